@@ -3,20 +3,21 @@
 # Copyright 2025 OliPi Project
 
 import os
+import math
 import time
 import yaml
 import threading
 from pathlib import Path
 from copy import deepcopy
-from .core_config import config, get_config, save_config, reload_config
+from collections import OrderedDict
+from .core_config import OLIPI_DIR, config, get_config, save_config, reload_config
 from importlib import import_module
 from olipi_core import screens
 
-env_dir = os.getenv("OLIPI_DIR")
-if env_dir:
-    OLIPI_DIR = Path(env_dir).expanduser().resolve()
-else:
-    OLIPI_DIR = Path.cwd()
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 THEME_PATH_MAIN = OLIPI_DIR / "theme_colors.yaml"
 THEME_PATH_USER = OLIPI_DIR / "theme_user.yaml"
@@ -42,6 +43,8 @@ poweroff_safe = screen.poweroff_safe
 poweron_safe = screen.poweron_safe
 
 display_format = getattr(screen, "DISPLAY_FORMAT", "MONO")
+_DISPLAY_FORMAT = display_format.upper()
+_IS_MONO = _DISPLAY_FORMAT == "MONO"
 
 clear_display()
 
@@ -91,7 +94,7 @@ def detect_refresh_interval():
 REFRESH_INTERVAL = detect_refresh_interval()
 
 THEME_NAME = get_config("settings", "color_theme", fallback="default", type=str)
-if display_format.upper() == "MONO":
+if _IS_MONO:
     THEME_NAME = "default"
 
 def deep_merge(base, override):
@@ -106,58 +109,102 @@ def deep_merge(base, override):
             base[key] = val
     return base
 
+# --- YAML cache (keyed by mtime + size, parsed data is shared read-only) ---
+_YAML_CACHE_SIZE = 16
+_yaml_cache = OrderedDict()
+
+def load_yaml_cached(path):
+    """Parse a YAML file, reusing the previous result while mtime and size are unchanged."""
+    st = os.stat(path)
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        _yaml_cache.move_to_end(path)
+        return cached[2]
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_Loader) or {}
+    _yaml_cache[path] = (st.st_mtime, st.st_size, data)
+    _yaml_cache.move_to_end(path)
+    if len(_yaml_cache) > _YAML_CACHE_SIZE:
+        _yaml_cache.popitem(last=False)
+    return data
+
 def load_theme_file():
     themes = {}
     if THEME_PATH_MAIN.exists():
-        with THEME_PATH_MAIN.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-            themes.update(data)
+        themes.update(load_yaml_cached(THEME_PATH_MAIN))
     default_theme = themes.get("default", {})
     if THEME_PATH_USER.exists():
-        with THEME_PATH_USER.open("r", encoding="utf-8") as f:
-            user_data = yaml.safe_load(f) or {}
-            for theme_name, theme_data in user_data.items():
-                base_theme = deepcopy(default_theme)
-                themes[theme_name] = deep_merge(base_theme, theme_data)
+        user_data = load_yaml_cached(THEME_PATH_USER)
+        for theme_name, theme_data in user_data.items():
+            base_theme = deepcopy(default_theme)
+            themes[theme_name] = deep_merge(base_theme, theme_data)
     return themes
 
 # --- Color handling ---
+_theme_generation = 0  # bumped on each load_theme(), invalidates cached frames
+
 def load_theme(theme_name="default"):
+    global _theme_generation
+    _theme_generation += 1
     themes = load_theme_file()
     theme = themes.get(theme_name, themes.get("default", {}))
 
     colors = theme.get("colors", {})
     for key, val in colors.items():
-        globals()["COLOR_" + key.upper()] = get_color(tuple(val))
-
-def get_color(color):
-    """Return color adapted to the screen's pixel format (RGB, BGR, MONO)."""
-    # Monochrome screen
-    if display_format.upper() == "MONO":
-        if isinstance(color, int):
-            return color  # Already 0..255
-        elif isinstance(color, tuple) and len(color) == 3:
-            r, g, b = color
-            # Convert to grayscale luminance
-            return int(0.299*r + 0.587*g + 0.114*b)
+        try:
+            r, g, b = val
+        except ValueError:
+            globals()["COLOR_" + key.upper()] = get_color(tuple(val))
         else:
-            return 255  # fallback = white
-    # RGB screen
-    if display_format.upper() == "RGB":
-        return color
-    # BGR screen
-    if display_format.upper() == "BGR":
-        if isinstance(color, tuple) and len(color) == 3:
-            r, g, b = color
-            return (b, g, r)
-        else:
-            return color
-    # Unknown case, return as is
+            globals()["COLOR_" + key.upper()] = get_color_rgb_tuple(r, g, b)
+
+def _luma(r, g, b):
+    """Grayscale luminance 0..255 (fixed-point 0.299/0.587/0.114)."""
+    return (r*77 + g*150 + b*29) >> 8
+
+def _get_color_mono(color):
+    """Monochrome screen: grayscale luminance 0..255."""
+    if isinstance(color, int):
+        return color  # Already 0..255
+    elif isinstance(color, tuple) and len(color) == 3:
+        return _luma(*color)
+    else:
+        return 255  # fallback = white
+
+def _get_color_rgb(color):
+    """RGB screen (or unknown format): return as is."""
     return color
 
+def _get_color_bgr(color):
+    """BGR screen: swap red and blue."""
+    if isinstance(color, tuple) and len(color) == 3:
+        r, g, b = color
+        return (b, g, r)
+    else:
+        return color
+
+# Return color adapted to the screen's pixel format (RGB, BGR, MONO), picked once.
+get_color = {
+    "MONO": _get_color_mono,
+    "RGB": _get_color_rgb,
+    "BGR": _get_color_bgr,
+}.get(_DISPLAY_FORMAT, _get_color_rgb)
+
+# Same conversion for an already unpacked (r, g, b) triple: no type checks.
+get_color_rgb_tuple = {
+    "MONO": _luma,
+    "RGB": lambda r, g, b: (r, g, b),
+    "BGR": lambda r, g, b: (b, g, r),
+}.get(_DISPLAY_FORMAT, lambda r, g, b: (r, g, b))
+
 load_theme(THEME_NAME)
 
 message_text = None
+_message_layout = None
+_message_layout_text = None
+_message_box_key = None
+_message_box = None
+_expire_timer = None
 message_start_time = 0
 message_permanent = False
 scroll_offset_message = 0
@@ -187,26 +234,34 @@ def reset_scroll(*keys):
             state["phase"] = "pause_start"
 
 translations = {}
+_tpl_has_format = {}  # key -> template contains "{" (needs str.format)
 def load_translations(script_name="script"):
     global translations
     translations.clear()
+    _tpl_has_format.clear()
 
     lang_dir = OLIPI_DIR / "language"
     selected_file = lang_dir / f"{script_name}_{LANGUAGE}.yaml"
     fallback_file = lang_dir / f"{script_name}_en.yaml"
 
     if selected_file.exists():
-        with open(selected_file, "r", encoding="utf-8") as f:
-            translations.update(yaml.safe_load(f) or {})
+        translations.update(load_yaml_cached(selected_file))
     elif fallback_file.exists():
         print(f"Translation file not found: {selected_file.name}, using fallback: {fallback_file.name}")
-        with open(fallback_file, "r", encoding="utf-8") as f:
-            translations.update(yaml.safe_load(f) or {})
+        translations.update(load_yaml_cached(fallback_file))
     else:
         print(f"No translation file found for script: {script_name}")
 
+    for k, v in translations.items():
+        _tpl_has_format[k] = not isinstance(v, str) or "{" in v
+
 def t(key, **kwargs):
     template = translations.get(key, key)
+    has_format = _tpl_has_format.get(key)
+    if has_format is None:
+        has_format = "{" in template
+    if not has_format:
+        return template
     try:
         return template.format(**kwargs)
     except KeyError as e:
@@ -225,54 +280,215 @@ def get_theme_menu():
         menu.append({"id": theme_id, "label": label})
     return menu
 
+# --- Text measurement cache (keyed by font + string, LRU bounded) ---
+_TEXT_CACHE_SIZE = 512
+_text_len_cache = OrderedDict()
+_bbox_cache = OrderedDict()
+
+def _textlen(text, font):
+    """Memoized draw.textlength()."""
+    k = (id(font), text)
+    v = _text_len_cache.get(k)
+    if v is None:
+        v = draw.textlength(text, font=font)
+        _text_len_cache[k] = v
+        if len(_text_len_cache) > _TEXT_CACHE_SIZE:
+            _text_len_cache.popitem(last=False)
+    else:
+        _text_len_cache.move_to_end(k)
+    return v
+
+def _getbbox(text, font):
+    """Memoized font.getbbox()."""
+    k = (id(font), text)
+    v = _bbox_cache.get(k)
+    if v is None:
+        v = font.getbbox(text)
+        _bbox_cache[k] = v
+        if len(_bbox_cache) > _TEXT_CACHE_SIZE:
+            _bbox_cache.popitem(last=False)
+    else:
+        _bbox_cache.move_to_end(k)
+    return v
+
+# --- Pre-rendered text masks (glyphs rasterized once, blitted per frame) ---
+_TEXT_IMG_CACHE_SIZE = 64
+_text_img_cache = OrderedDict()
+
+def _render_text(text, font):
+    """Return (mask, left, top): the glyph coverage of `text` as a tight "L" image."""
+    k = (id(font), text)
+    v = _text_img_cache.get(k)
+    if v is None:
+        left, top, right, bottom = _getbbox(text, font)
+        mask = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+        d = screen.ImageDraw.Draw(mask)
+        d.fontmode = draw.fontmode
+        d.text((-left, -top), text, font=font, fill=255)
+        v = (mask, left, top)
+        _text_img_cache[k] = v
+        if len(_text_img_cache) > _TEXT_IMG_CACHE_SIZE:
+            _text_img_cache.popitem(last=False)
+    else:
+        _text_img_cache.move_to_end(k)
+    return v
+
+def _draw_text(xy, text, font, fill):
+    """draw.text() through the mask cache; sub-pixel positions fall back to FreeType."""
+    x, y = xy
+    if x != int(x) or y != int(y):
+        draw.text(xy, text, font=font, fill=fill)
+        return
+    mask, left, top = _render_text(text, font)
+    draw.bitmap((int(x) + left, int(y) + top), mask, fill=fill)
+
+# --- Menu layout (screen/font invariant, computed once) ---
+_MENU_BORDER = 1
+_PADDING_X = max(1, int(width * 0.02))
+_PADDING_Y = max(1, int(height * 0.01))
+
+_TITLE_BBOX = font_title_menu.getbbox("Ay")
+_TITLE_H = _TITLE_BBOX[3] - _TITLE_BBOX[1]
+
+# Title → items spacing based on screen height
+if height <= 64:
+    _SPACING_TITLE_ITEMS = 5
+    _PADDING_ITEM = 1
+elif height < 128:
+    _SPACING_TITLE_ITEMS = 5
+    _PADDING_ITEM = 2
+else:
+    _SPACING_TITLE_ITEMS = 6
+    _PADDING_ITEM = 2
+
+# Fixed line metrics ("Ay")
+_ITEM_BBOX = font_item_menu.getbbox("Ay")
+_ITEM_H = _ITEM_BBOX[3] - _ITEM_BBOX[1]
+_LINE_HEIGHT = _ITEM_H + _PADDING_ITEM
+
+# Number of visible lines (include borders + paddings)
+_AVAIL_HEIGHT_FOR_ITEMS = height - (_MENU_BORDER + _PADDING_Y + _TITLE_H + _SPACING_TITLE_ITEMS + _PADDING_Y + _MENU_BORDER)
+_MAX_LINES_FIT = max(1, _AVAIL_HEIGHT_FOR_ITEMS // _LINE_HEIGHT)
+
+_INNER_WIDTH_GUESS = width - 2 * (_MENU_BORDER + _PADDING_X)
+_INNER_WIDTH = width - (_MENU_BORDER + _PADDING_X + _MENU_BORDER)
+
+# --- Selected item scroll timings ---
+MENU_SCROLL_MIN_INTERVAL = 0.05
+MENU_SCROLL_MAX_INTERVAL = 0.12
+MENU_SCROLL_PAUSE_DURATION = 0.6
+MENU_SCROLL_BLANK_DURATION = 0.2
+
+def _update_item_scroll(state_i, text_w, avail, now):
+    """Advance the selected item scroll (pause → scroll → pause). Return False while text is blanked."""
+    if text_w <= avail:
+        # text fits; reset
+        state_i["offset"] = 0
+        state_i["phase"] = "pause_start"
+        state_i["pause_start_time"] = now
+        return True
+
+    # read state once, write back only what changed
+    phase = state_i.get("phase", "pause_start")
+    offset = state_i.get("offset", 0)
+    pause_start = state_i.get("pause_start_time", 0)
+
+    if phase == "pause_start":
+        if offset:
+            state_i["offset"] = offset = 0
+        if now - pause_start > MENU_SCROLL_PAUSE_DURATION:
+            state_i["phase"] = phase = "scrolling"
+            state_i["last_update"] = now
+
+    elif phase == "scrolling":
+        # Adaptive scroll speed
+        ratio = text_w / float(avail)
+        interval = SCROLL_SPEED_MENU / max(0.001, ratio)
+        scroll_speed = max(MENU_SCROLL_MIN_INTERVAL, min(MENU_SCROLL_MAX_INTERVAL, interval))
+        if now - state_i.get("last_update", 0) > scroll_speed:
+            offset += 1
+            state_i["offset"] = offset
+            state_i["last_update"] = now
+            if offset >= (text_w - avail):
+                # enter pause_end and mark its start
+                state_i["phase"] = phase = "pause_end"
+                state_i["pause_start_time"] = pause_start = now
+
+    elif phase == "pause_end":
+        # if pause_end completed, reset to pause_start
+        if now - pause_start >= MENU_SCROLL_PAUSE_DURATION:
+            state_i["offset"] = 0
+            state_i["phase"] = phase = "pause_start"
+            state_i["pause_start_time"] = now
+        # else: keep offset at end (no change) and show text normally
+
+    # hide text only during the short BLANK_DURATION at the end of the pause
+    if phase == "pause_end":
+        elapsed = now - pause_start
+        if MENU_SCROLL_PAUSE_DURATION - MENU_SCROLL_BLANK_DURATION <= elapsed < MENU_SCROLL_PAUSE_DURATION:
+            return False
+    return True
+
+# --- Last rendered menu frame (pasted back while nothing changes) ---
+_menu_frame_key = None
+_menu_frame = None
+
 def draw_custom_menu(options, selection, title="Menu", multi=None, checkmark="✓ "):
     """Full-width menu, spacing/scroll dynamic, fixed line height, selection rectangle aligned to text."""
-    global scroll_state
+    global scroll_state, _menu_frame_key, _menu_frame
     now = time.time()
 
-    # --- Panel geometry (full screen) ---
-    menu_width = width
-    border = 1
-    padding_x = max(1, int(menu_width * 0.02))
-    padding_y = max(1, int(height * 0.01))
-
     # --- Title & linear scroll ---
     state_t = scroll_state["menu_title"]
-    title_w = draw.textlength(title, font=font_title_menu)
-    bbox_title = font_title_menu.getbbox("Ay")
-    title_h = bbox_title[3] - bbox_title[1]
-
-    inner_width_guess = menu_width - 2 * (border + padding_x)
-    if title_w > inner_width_guess and now - state_t.get("last_update", 0) > SCROLL_SPEED_LINEAR:
-        scroll_w = title_w + SCROLL_TITLE_PADDING_END
-        state_t["offset"] = (state_t.get("offset", 0) + 1) % scroll_w
-        state_t["last_update"] = now
-    else:
-        state_t.setdefault("offset", 0)
-
-    # --- Title → items spacing based on screen height ---
-    if height <= 64:
-        spacing_title_items = 5
-        padding_item = 1
-    elif height < 128:
-        spacing_title_items = 5
-        padding_item = 2
-    else:
-        spacing_title_items = 6
-        padding_item = 2
+    title_w = _textlen(title, font_title_menu)
+    title_off = state_t.get("offset", 0)
 
-    # --- Fixed line metrics ("Ay") ---
-    item_bbox = font_item_menu.getbbox("Ay")
-    item_h = item_bbox[3] - item_bbox[1]
-    line_height = item_h + padding_item
+    if title_w > _INNER_WIDTH_GUESS and now - state_t.get("last_update", 0) > SCROLL_SPEED_LINEAR:
+        title_off = (title_off + 1) % (title_w + SCROLL_TITLE_PADDING_END)
+        state_t["offset"] = title_off
+        state_t["last_update"] = now
+    elif "offset" not in state_t:
+        state_t["offset"] = 0
 
-    # --- Number of visible lines (include borders + paddings) ---
-    avail_height_for_items = height - (border + padding_y + title_h + spacing_title_items + padding_y + border)
-    max_lines_fit = max(1, avail_height_for_items // line_height)
-    visible_lines = min(len(options), max_lines_fit)
+    menu_width = width
+    border = _MENU_BORDER
+    padding_x = _PADDING_X
+    title_h = _TITLE_H
+    item_bbox = _ITEM_BBOX
+    item_h = _ITEM_H
+    line_height = _LINE_HEIGHT
+    inner_width = _INNER_WIDTH
+    avail = inner_width - padding_x
+    visible_lines = min(len(options), _MAX_LINES_FIT)
+
+    def item_text(entry):
+        label = entry[0] if isinstance(entry, tuple) else entry
+        prefix = checkmark if (multi and label in multi) else ""
+        return prefix + label
+
+    # --- Selected item scroll state (updated before deciding whether to redraw) ---
+    state_i = scroll_state["menu_item"]
+    sel_txt = None
+    sel_w = 0
+    sel_draw_text = True
+    if 0 <= selection < len(options):
+        sel_txt = item_text(options[selection])
+        sel_w = _textlen(sel_txt, font_item_menu)
+        sel_draw_text = _update_item_scroll(state_i, sel_w, avail, now)
+    sel_off = state_i.get("offset", 0) if sel_w > avail else 0
+
+    # --- Skip rendering when the frame would be identical to the last one ---
+    frame_key = (
+        title, tuple(options), selection, tuple(multi) if multi else None, checkmark,
+        title_off if title_w > inner_width else 0,
+        sel_off, sel_draw_text, _theme_generation,
+    )
+    if frame_key == _menu_frame_key and _menu_frame is not None:
+        image.paste(_menu_frame)
+        return
 
     # --- Panel dimensions & vertical centering ---
-    menu_inner_height = title_h + spacing_title_items + visible_lines * line_height + 2 * padding_y
+    menu_inner_height = title_h + _SPACING_TITLE_ITEMS + visible_lines * line_height + 2 * _PADDING_Y
     MENU_HEIGHT = menu_inner_height + 2 * border
     y0 = max(0, (height - MENU_HEIGHT) // 2)
     x0 = 0
@@ -283,92 +499,37 @@ def draw_custom_menu(options, selection, title="Menu", multi=None, checkmark="
                    outline=COLOR_MENU_OUTLINE, fill=COLOR_MENU_BG)
 
     inner_x = x0 + border + padding_x
-    inner_y = y0 + border + padding_y
-    inner_width = menu_width - (border + padding_x + border)
+    inner_y = y0 + border + _PADDING_Y
 
     # --- Draw title (centered / scroll) ---
     title_y = inner_y
     if title_w <= inner_width:
         x_title = inner_x + (inner_width - title_w) // 2
-        draw.text((x_title, title_y), title, font=font_title_menu, fill=COLOR_MENU_TITLE)
+        _draw_text((x_title, title_y), title, font_title_menu, COLOR_MENU_TITLE)
     else:
-        off = state_t["offset"]
-        draw.text((inner_x - off, title_y), title, font=font_title_menu, fill=COLOR_MENU_TITLE)
-        draw.text((inner_x - off + title_w + SCROLL_TITLE_PADDING_END, title_y),
-                  title, font=font_title_menu, fill=COLOR_MENU_TITLE)
+        off = title_off
+        _draw_text((inner_x - off, title_y), title, font_title_menu, COLOR_MENU_TITLE)
+        _draw_text((inner_x - off + title_w + SCROLL_TITLE_PADDING_END, title_y),
+                   title, font_title_menu, COLOR_MENU_TITLE)
 
     # --- Compute visible window of items (center selection) ---
     start_idx = max(0, selection - visible_lines // 2)
     if start_idx + visible_lines > len(options):
         start_idx = max(0, len(options) - visible_lines)
 
-    list_y0 = inner_y + title_h + spacing_title_items
+    list_y0 = inner_y + title_h + _SPACING_TITLE_ITEMS
 
     for i in range(visible_lines):
         idx = start_idx + i
         if idx >= len(options):
             break
 
-        entry = options[idx]
-        label = entry[0] if isinstance(entry, tuple) else entry
-        prefix = checkmark if (multi and label in multi) else ""
-        full_txt = prefix + label
-
         y_item = list_y0 + i * line_height
         text_y = y_item + (line_height - item_h) // 2 - item_bbox[1]
         x_text_base = inner_x
 
         if idx == selection:
-            # --- Smooth adaptive scroll (pause → scroll → pause) ---
-            state_i = scroll_state["menu_item"]
-            text_w = draw.textlength(full_txt, font=font_item_menu)
-            avail = inner_width - padding_x
-
-            if text_w > avail:
-                # Adaptive scroll speed
-                BASE_INTERVAL = SCROLL_SPEED_MENU
-                MIN_INTERVAL = 0.05
-                MAX_INTERVAL = 0.12
-                PAUSE_DURATION = 0.6
-                BLANK_DURATION = 0.2
-                ratio = text_w / float(avail)
-                interval = BASE_INTERVAL / max(0.001, ratio)
-                scroll_speed = max(MIN_INTERVAL, min(MAX_INTERVAL, interval))
-
-                phase = state_i.get("phase", "pause_start")
-                if phase == "pause_start":
-                    state_i["offset"] = 0
-                    if now - state_i.get("pause_start_time", 0) > PAUSE_DURATION:
-                        state_i["phase"] = "scrolling"
-                        state_i["last_update"] = now
-
-                elif phase == "scrolling":
-                    if now - state_i.get("last_update", 0) > scroll_speed:
-                        state_i["offset"] += 1
-                        state_i["last_update"] = now
-                        if state_i["offset"] >= (text_w - avail):
-                            # enter pause_end and mark its start
-                            state_i["phase"] = "pause_end"
-                            state_i["pause_start_time"] = now
-
-                elif phase == "pause_end":
-                    # compute elapsed in pause_end
-                    elapsed = now - state_i.get("pause_start_time", 0)
-                    # if pause_end completed, reset to pause_start
-                    if elapsed >= PAUSE_DURATION:
-                        state_i["offset"] = 0
-                        state_i["phase"] = "pause_start"
-                        state_i["pause_start_time"] = now
-                    # else: keep offset at end (no change) and show text normally
-            else:
-                # text fits; reset
-                state_i["offset"] = 0
-                state_i["phase"] = "pause_start"
-                state_i["pause_start_time"] = now
-
-            # compute x_text once
-            off = state_i.get("offset", 0)
-            x_text = x_text_base - off if text_w > avail else x_text_base
+            x_text = x_text_base - sel_off
 
             # selection rectangle (always shown)
             sel_top = text_y + item_bbox[1] - 3
@@ -378,19 +539,19 @@ def draw_custom_menu(options, selection, title="Menu", multi=None, checkmark="
             draw.rectangle((sel_x0, sel_top, sel_x1, sel_bot),
                         outline=COLOR_MENU_OUTLINE, fill=COLOR_MENU_SELECTED_BG)
 
-            # determine whether to draw text:
-            draw_text = True
-            if state_i.get("phase") == "pause_end":
-                elapsed = now - state_i.get("pause_start_time", 0)
-                # hide text only during the short BLANK_DURATION at the end of the pause
-                if elapsed >= (PAUSE_DURATION - BLANK_DURATION) and elapsed < PAUSE_DURATION:
-                    draw_text = False
-
-            if draw_text:
-                draw.text((x_text, text_y), full_txt, font=font_item_menu, fill=COLOR_MENU_SELECTED_TEXT)
+            if sel_draw_text:
+                _draw_text((x_text, text_y), sel_txt, font_item_menu, COLOR_MENU_SELECTED_TEXT)
             # else: skip drawing text -> creates the brief disappearance just before reset
         else:
-            draw.text((x_text_base, text_y), full_txt, font=font_item_menu, fill=COLOR_MENU_TEXT)
+            _draw_text((x_text_base, text_y), item_text(options[idx]), font_item_menu, COLOR_MENU_TEXT)
+
+    # keep a copy only once the same key comes back: a scrolling menu changes
+    # every frame and would pay for a full-screen copy it never reuses
+    if frame_key == _menu_frame_key:
+        _menu_frame = image.copy()
+    else:
+        _menu_frame_key = frame_key
+        _menu_frame = None
 
 def compute_message_layout(text):
     # dynamic paddings / margins based on screen
@@ -402,7 +563,7 @@ def compute_message_layout(text):
     max_box_w = max(80, width - 2 * margin)
 
     # measure full text width (single-line)
-    test_w = draw.textlength(text, font=font_message)
+    test_w = _textlen(text, font_message)
 
     # choose box width: either snug to text or clamp to max_box_w
     if test_w + 2 * padding_x <= max_box_w:
@@ -417,8 +578,8 @@ def compute_message_layout(text):
     cur = ""
     for w in words:
         candidate = (cur + " " + w) if cur else w
-        # measure candidate width using font getbbox
-        w_box = font_message.getbbox(candidate)
+        # measure candidate width using font getbbox (cached)
+        w_box = _getbbox(candidate, font_message)
         w_len = w_box[2] - w_box[0]
         if w_len <= inner_w:
             cur = candidate
@@ -430,7 +591,8 @@ def compute_message_layout(text):
         lines.append(cur)
 
     # line height metric (stable baseline using "Ay")
-    line_h = font_message.getbbox("Ay")[3] - font_message.getbbox("Ay")[1] + 2
+    ay_box = _getbbox("Ay", font_message)
+    line_h = ay_box[3] - ay_box[1] + 2
     total_text_height = len(lines) * line_h
     # single line -> more padding, multi-line -> normal
     if len(lines) == 1:
@@ -456,33 +618,56 @@ def compute_message_layout(text):
         "MESS_HEIGHT": MESS_HEIGHT,
     }
 
+def get_message_layout(text):
+    """Return the layout for text, computed once per message."""
+    global _message_layout, _message_layout_text
+    layout = _message_layout
+    if layout is None or _message_layout_text != text:
+        layout = compute_message_layout(text)
+        _message_layout = layout
+        _message_layout_text = text
+    return layout
+
 def show_message(text, permanent=False):
     """Prepare message to display (timed or permanent)."""
-    global message_text, message_start_time, message_permanent
+    global message_text, message_start_time, message_permanent, _expire_timer
     message_permanent = permanent
     message_text = text
 
+    # compute layout once; draw_message reuses it every frame
+    layout = get_message_layout(text)
+
+    if _expire_timer is not None:
+        _expire_timer.cancel()
+        _expire_timer = None
+
     if permanent:
         message_start_time = float('inf')
         return
 
-    # compute layout so we know number of lines and duration
-    layout = compute_message_layout(text)
+    # number of lines gives the duration
     lines = layout["lines"]
 
     per_line = 2.0
     duration = min(max(len(lines) * per_line, 2.0), 30.0)
     message_start_time = time.time() + duration
 
+    # one-shot timer at expiry instead of a polling thread
+    _expire_timer = threading.Timer(duration, _clear_message, args=(message_start_time,))
+    _expire_timer.daemon = True
+    _expire_timer.start()
+
 def draw_message():
     """Draw currently active message centered on screen with adaptive box sizing."""
-    global scroll_offset_message, last_scroll_time
+    global scroll_offset_message, last_scroll_time, _message_box_key, _message_box
 
-    if not message_text:
+    # the expiry timer may clear message_text while this frame is drawn
+    text = message_text
+    if not text:
         return
 
-    # compute layout (must match show_message)
-    layout = compute_message_layout(message_text)
+    # layout cached by show_message (recomputed only if message_text changed)
+    layout = get_message_layout(text)
     MESS_WIDTH = layout["width"]
     MESS_HEIGHT = layout["MESS_HEIGHT"]
     MESS_PADDING_X = layout["padding_x"]
@@ -512,10 +697,18 @@ def draw_message():
         y_start = y0 + (MESS_HEIGHT - total_text_height) // 2
 
     # draw background under message box
-    if display_format.upper() == "MONO":
+    if _IS_MONO:
         draw.rectangle((0, 0, width, height), fill=COLOR_BG)
     else:
         mask_overlay()
+
+    # box unchanged since last frame → paste it back instead of re-rendering text
+    box_key = (text, scroll_offset_message, _theme_generation)
+    box_origin = (int(x0), int(y0))
+    if box_key == _message_box_key and _message_box is not None:
+        image.paste(_message_box, box_origin)
+        return
+
     # draw box and then lines that fall inside visible area
     draw.rectangle((x0, y0, x0 + MESS_WIDTH, y0 + MESS_HEIGHT), outline=COLOR_MESSAGE_OUTLINE, fill=COLOR_MESSAGE_BG)
 
@@ -523,25 +716,42 @@ def draw_message():
         y = y_start + i * line_h
         # only draw lines that fit inside the inner area
         if y >= y0 + MESS_PADDING_Y and y + line_h <= y0 + MESS_HEIGHT - MESS_PADDING_Y:
-            w_box = font_message.getbbox(ln)
+            w_box = _getbbox(ln, font_message)
             text_w = w_box[2] - w_box[0]
             x_text = x0 + (MESS_WIDTH - text_w) // 2
             draw.text((x_text, y), ln, font=font_message, fill=COLOR_MESSAGE_TEXT)
 
-def message_updater():
-    global message_text, message_start_time, scroll_offset_message, message_permanent
-    while True:
-        if message_text and not message_permanent and time.time() >= message_start_time:
-            message_text = None
-            scroll_offset_message = 0
-        time.sleep(1)
+    _message_box_key = box_key
+    # the box may end on a fractional pixel: round the crop outwards, not the layout
+    _message_box = image.crop((box_origin[0], box_origin[1],
+                               math.ceil(x0 + MESS_WIDTH) + 1, math.ceil(y0 + MESS_HEIGHT) + 1))
+
+def _clear_message(expiry):
+    """Expire the timed message whose expiry time is expiry (called by the show_message timer)."""
+    global message_text, scroll_offset_message
+    # only the text is cleared here: the layout cache belongs to the drawing thread
+    if message_text and not message_permanent and message_start_time == expiry:
+        message_text = None
+        scroll_offset_message = 0
 
 def start_message_updater():
-    threading.Thread(target=message_updater, daemon=True).start()
+    """Kept for compatibility: timed messages now expire through a one-shot timer."""
+    pass
+
+# mask is static: decode, resize and split once (RGB + alpha) for a C-level paste
+_MASK_RGB = None
+_MASK_ALPHA = None
+if not _IS_MONO:
+    try:
+        _mask = Image.open(MASK_PATH).convert("RGBA").resize((width, height), Image.Resampling.LANCZOS)
+        _MASK_RGB = _mask.convert(image.mode)
+        _MASK_ALPHA = _mask.getchannel("A")
+        del _mask
+    except Exception as e:
+        print(f"Mask overlay unavailable: {e}")
 
 def mask_overlay():
-    overlay = Image.open(MASK_PATH).convert("RGBA")
-    overlay = overlay.resize((width, height), Image.Resampling.LANCZOS)
-    base = image.copy()
-    composite = Image.alpha_composite(base.convert("RGBA"), overlay)
-    image.paste(composite)
+    if _MASK_RGB is None:
+        draw.rectangle((0, 0, width, height), fill=COLOR_BG)
+        return
+    image.paste(_MASK_RGB, (0, 0), _MASK_ALPHA)
@@ -17,18 +17,51 @@ CONFIG_PATH = OLIPI_DIR / "config.ini"
 config = configparser.ConfigParser()
 config.read(CONFIG_PATH)
 
+# flat {(section, option): raw} snapshot of config, and typed values already
+# resolved by get_config; both are dropped whenever config changes
+_MISSING = object()
+_flat = None
+_parsed_cache = {}
+
+def _build_flat():
+    flat = {}
+    for sec in config.sections():
+        for k in config.options(sec):
+            try:
+                flat[(sec, k)] = config.get(sec, k)
+            except configparser.Error:
+                pass  # e.g. a broken %-reference: reads as missing, as before
+    return flat
+
 def get_config(section, key, fallback=None, type=str):
-    try:
-        if type == bool:
-            return config.getboolean(section, key, fallback=fallback)
-        elif type == int:
-            return config.getint(section, key, fallback=fallback)
-        elif type == float:
-            return config.getfloat(section, key, fallback=fallback)
-        else:
-            return config.get(section, key, fallback=fallback)
-    except Exception:
+    global _flat
+    cache_key = (section, key, type)
+    value = _parsed_cache.get(cache_key, _MISSING)
+    if value is _MISSING:
+        if _flat is None:
+            _flat = _build_flat()
+        raw = _flat.get((section, config.optionxform(key)))
+        if raw is not None:
+            try:
+                if type == bool:
+                    value = config.BOOLEAN_STATES[raw.lower()]
+                elif type == int:
+                    value = int(raw)
+                elif type == float:
+                    value = float(raw)
+                else:
+                    value = raw
+            except (KeyError, ValueError):
+                pass
+        _parsed_cache[cache_key] = value
+    if value is _MISSING:
         return fallback
+    return value
+
+def _invalidate_cache():
+    global _flat
+    _flat = None
+    _parsed_cache.clear()
 
 def save_config(key, value, section="settings", preserve_case=False):
     """Write a value while preserving comments, structure, and spacing."""
@@ -41,7 +74,11 @@ def save_config(key, value, section="settings", preserve_case=False):
     if not CONFIG_PATH.exists():
         # file doesn't exist → create with the section and key/value
         CONFIG_PATH.write_text(f"[{section}]\n{key} = {value}\n", encoding="utf-8")
-        config.read(CONFIG_PATH)
+        _set_in_memory(section, key, value)
+        return
+
+    # skip no-op writes (UI code often writes the current setting back)
+    if config.has_option(section, key) and config.get(section, key, raw=True) == value:
         return
 
     lines = CONFIG_PATH.read_text(encoding="utf-8").splitlines()
@@ -98,7 +135,19 @@ def save_config(key, value, section="settings", preserve_case=False):
 
     # write back to file
     CONFIG_PATH.write_text("\n".join(new_lines) + "\n", encoding="utf-8")
-    config.read(CONFIG_PATH)
+    _set_in_memory(section, key, value)
+
+def _set_in_memory(section, key, value):
+    """Mirror a written value into the loaded config instead of re-parsing the file."""
+    try:
+        if not config.has_section(section):
+            config.add_section(section)
+        config.set(section, key, value)
+    except ValueError:
+        # value not accepted by interpolation → fall back to a full re-read
+        config.read(CONFIG_PATH)
+    _invalidate_cache()
 
 def reload_config():
     config.read(CONFIG_PATH)
+    _invalidate_cache()
@@ -2,10 +2,21 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright 2025 OliPi Project
 
+import os
+import sys
+import configparser
+import heapq
 import threading
 import time
-import subprocess
-import select
+import socket
+import selectors
+from collections import deque
+from dataclasses import dataclass
+from functools import partial
+from datetime import timedelta
+from itertools import combinations
+from types import MappingProxyType
+from typing import Optional, Tuple
 
 try:
     from RPi import GPIO
@@ -14,152 +25,383 @@ try:
 except ImportError:
     GPIO = None
 
-repeat_lock = threading.Lock()
+# Optional libgpiod v2 bindings: line events come from a pollable fd with kernel timestamps
+try:
+    import gpiod
+    from gpiod.line import Bias, Direction, Edge, Value
+    if not hasattr(gpiod, "request_lines"):  # v1 bindings, different API
+        gpiod = None
+except ImportError:
+    gpiod = None
 
 # === Constants ===
 DEBOUNCE_DELAY = 0.15  # default fallback
+REPEAT_INTERVAL = 0.08  # seconds between repeats of a held key
+_REPEAT_NS = int(REPEAT_INTERVAL * 1_000_000_000)  # timer deadlines are integer monotonic_ns
 
-repeat_threads = {}
 repeat_counts = {}
 
-remote_mapping = {}
+remote_mapping = MappingProxyType({})
+_UNSET_REMOTE_KEYS = frozenset(("", "—", "-", "NONE", "YOUR_REMOTE_KEY"))  # placeholders in [remote_mapping]
+_has_remap = False  # skip the remap lookup entirely when no mapping is configured
 
 debug = False
 
-# === Shared data ===
-debounce_data = {}
-
 # === External hooks ===
-show_message = None
-press_callback = None
+def _no_message(msg):
+    pass
 
-# --- Common repeat sender for GPIO and rotary button ---
-def repeat_sender(key: str, check_fn):
+show_message = _no_message
+press_callback = None
+steps_callback = None  # optional: steps_callback(key, n) gets rotary bursts as one call
+
+# === Input event loop (one thread: fd readiness + timers) ===
+_selector = selectors.DefaultSelector()
+_loop_thread = None
+_loop_lock = threading.Lock()
+_timers = []     # heap of [when_ns, seq, callback, args]; callback None = cancelled
+_timer_seq = 0
+_wake_w = None   # write end of the self-pipe waking the loop for new timers
+
+def _input_loop():
+    """Wait on all registered fds and the next timer, run handlers inline."""
+    while True:
+        with _loop_lock:
+            timeout = max(0, _timers[0][0] - time.monotonic_ns()) / 1e9 if _timers else None
+        for sel_key, _ in _selector.select(timeout):
+            try:
+                sel_key.data(sel_key.fileobj)
+            except Exception as e:
+                print("error input loop:", e)
+
+        now = time.monotonic_ns()
+        due = []
+        with _loop_lock:
+            while _timers and _timers[0][0] <= now:
+                due.append(heapq.heappop(_timers))
+        for _, _, callback, args in due:
+            if callback is None:
+                continue
+            try:
+                callback(*args)
+            except Exception as e:
+                print("error input loop:", e)
+
+def _ensure_loop():
+    global _loop_thread, _wake_w
+    with _loop_lock:
+        if _loop_thread is not None:
+            return
+        wake_r, _wake_w = os.pipe()
+        os.set_blocking(wake_r, False)
+        os.set_blocking(_wake_w, False)
+        _selector.register(wake_r, selectors.EVENT_READ, lambda fd: os.read(fd, 4096))
+        _loop_thread = threading.Thread(target=_input_loop, daemon=True)
+        _loop_thread.start()
+
+def register_reader(fileobj, handler):
+    """Call handler(fileobj) from the input loop each time fileobj is readable."""
+    _ensure_loop()
+    _selector.register(fileobj, selectors.EVENT_READ, handler)
+
+def unregister_reader(fileobj):
+    try:
+        _selector.unregister(fileobj)
+    except (KeyError, ValueError):
+        pass
+
+def call_at(when_ns, callback, *args):
+    """Run callback(*args) on the input loop at time.monotonic_ns() `when_ns`. Thread-safe."""
+    global _timer_seq
+    _ensure_loop()
+    with _loop_lock:
+        _timer_seq += 1
+        entry = [when_ns, _timer_seq, callback, args]
+        heapq.heappush(_timers, entry)
+        wake = _timers[0] is entry and threading.current_thread() is not _loop_thread
+    if wake:
+        try:
+            os.write(_wake_w, b"\0")
+        except BlockingIOError:
+            pass  # loop is already due to wake up
+    return entry
+
+def call_later(delay, callback, *args):
+    """Run callback(*args) on the input loop after `delay` seconds."""
+    return call_at(time.monotonic_ns() + int(delay * 1_000_000_000), callback, *args)
+
+def cancel_timer(entry):
+    """Cancel a call_at()/call_later() entry (no-op once it has run)."""
+    if entry is not None:
+        entry[2] = None
+
+# --- Common repeat timers for GPIO buttons and MPR121 pads ---
+# process_key() and the repeat helpers run on the input loop and on RPi.GPIO
+# callback threads. _state_lock guards the repeat tables and the per-key
+# debounce records; it is re-entrant so a holder may call back into them.
+# Callbacks (check_fn, press_callback) are never invoked while holding it.
+_state_lock = threading.RLock()
+_active_repeats = {}  # key -> check_fn, for keys currently held
+
+def _repeat_tick(key, check_fn, due, _active=_active_repeats, _counts=repeat_counts):
+    """Emit one repeat of key if it is still held, then re-arm for the next one."""
+    if _active.get(key) is not check_fn:
+        return  # released (or re-pressed) meanwhile
+    try:
+        pressed = check_fn()
+    except Exception as e:
+        print("error repeat check:", e)
+        pressed = False
+    with _state_lock:
+        if _active.get(key) is not check_fn:
+            return
+        if not pressed:
+            del _active[key]
+            return
+        count = _counts.get(key, 0) + 1
+        _counts[key] = count
+        call_at(due + _REPEAT_NS, _repeat_tick, key, check_fn, due + _REPEAT_NS)
+    process_key(key, count, 0.1)
+
+def start_repeat(key, check_fn):
     """
-    Generic repeat sender.
-    - key: logical key name (e.g. "KEY_UP")
-    - check_fn: callable returning True while "pressed"
-    - REPEAT_INTERVAL: seconds between repeats
+    Emit the first press of key (0) and keep repeating it every REPEAT_INTERVAL
+    while check_fn() is True. Returns False if key is already held.
     """
-    REPEAT_INTERVAL = 0.08
-
-    while True:
-        time.sleep(REPEAT_INTERVAL)
-        with repeat_lock:
-            # Check if key still exists and is being pressed
-            if key not in repeat_counts or not check_fn():
-                break
-            repeat_counts[key] += 1
-            count = repeat_counts[key]
-
-        repeat_code = f"{count:02x}"
-        process_key(key, repeat_code, 0.1)
-
-    # Cleanup thread-safe
-    with repeat_lock:
-        repeat_counts.pop(key, None)
-        repeat_threads.pop(key, None)
+    if key in _active_repeats:
+        return False
+    with _state_lock:
+        if key in _active_repeats:
+            return False
+        repeat_counts[key] = 0
+        _active_repeats[key] = check_fn
+    due = time.monotonic_ns() + _REPEAT_NS
+    call_at(due, _repeat_tick, key, check_fn, due)
+    process_key(key, 0, 0.1)  # first press
+    return True
+
+def stop_repeat(key):
+    """Release key: no further repeats are emitted."""
+    with _state_lock:
+        _active_repeats.pop(key, None)
 
 # --- GPIO button event callback ---
+def _gpio_is_low(pin):
+    return GPIO.input(pin) == GPIO.LOW
+
 def gpio_event(button_pressed, key):
     """
-    GPIO callback: start a repeat thread that polls GPIO.input(button_pressed).
-    Existing semantics preserved: first press -> process_key(...,"00")
+    GPIO callback: start repeating the key while GPIO.input(button_pressed) stays LOW.
+    Existing semantics preserved: first press -> process_key(..., 0)
     """
     if GPIO.input(button_pressed) == GPIO.LOW:
-        if key not in repeat_threads:
-            repeat_counts[key] = 0
-            process_key(key, "00", 0.1)  # first press
-            # pass a check_fn that reads the GPIO pin
-            check_fn = lambda bp=button_pressed: GPIO.input(bp) == GPIO.LOW
-            t = threading.Thread(target=repeat_sender, args=(key, check_fn), daemon=True)
-            repeat_threads[key] = t
-            t.start()
+        start_repeat(key, partial(_gpio_is_low, button_pressed))
     else:
         # release: ensure we stop any repeat
-        repeat_counts.pop(key, None)
-        repeat_threads.pop(key, None)
-
-# === Key processing with debounce + remapping ===
-def process_key(key, repeat_code, DEBOUNCE_DELAY=DEBOUNCE_DELAY):
-    global debounce_data
+        stop_repeat(key)
 
-    # apply remapping if available
-    mapped_key = remote_mapping.get(key, key)
+def _line_is_low(req, pin):
+    return req.get_value(pin) == Value.INACTIVE
 
+def gpiod_buttons(pins, bouncetime_ms, chip="/dev/gpiochip0"):
+    """
+    gpiod backend for buttons: pins maps BCM offset -> key. The kernel debounces
+    the lines and the input loop reads their edge events; pressed = pulled LOW.
+    """
+    req = gpiod.request_lines(
+        chip,
+        consumer="olipi-buttons",
+        config={tuple(pins): gpiod.LineSettings(
+            direction=Direction.INPUT,
+            bias=Bias.PULL_UP,
+            edge_detection=Edge.BOTH,
+            debounce_period=timedelta(milliseconds=bouncetime_ms),
+        )},
+    )
+
+    def on_events(fd):
+        for ev in req.read_edge_events():
+            pin = ev.line_offset
+            if ev.event_type == ev.Type.FALLING_EDGE:
+                start_repeat(pins[pin], partial(_line_is_low, req, pin))
+            else:
+                stop_repeat(pins[pin])
+
+    register_reader(req.fd, on_events)
+
+# === Debounce (timers on the input loop, integer monotonic_ns deadlines) ===
+class _KeyState:
+    """Remap target and debounce state of a key, shared by all raw keys mapped to it."""
+    __slots__ = ("mapped", "deadline", "armed")
+
+    def __init__(self, mapped):
+        self.mapped = mapped
+        self.deadline = None  # deadline of the pending press, None = nothing pending
+        self.armed = None     # when the timer armed for this key fires, None = no timer
+
+_key_states = {}     # raw key -> _KeyState
+_mapped_states = {}  # mapped key -> _KeyState
+
+def _new_key_state(key):
+    mapped = remote_mapping.get(key, key) if _has_remap else key
+    with _state_lock:
+        st = _mapped_states.get(mapped)
+        if st is None:
+            st = _mapped_states[mapped] = _KeyState(mapped)
+        _key_states[key] = st
+    return st
+
+def _deliver_press(mapped_key):
     try:
-        rep = int(repeat_code, 16)
+        press_callback(mapped_key)
     except Exception as e:
-        if show_message:
-            show_message(f"error process_key: {e}")
-        print("error process_key:", e)
-        return
-
-    if rep == 0:
-        if mapped_key not in debounce_data:
-            debounce_data[mapped_key] = {"max_code": 0, "timer": None}
-        else:
-            debounce_data[mapped_key]["max_code"] = 0
+        print("error press_callback:", e)
+
+def _fire_press(st, when):
+    """Deliver the press once the key has been quiet for its debounce delay."""
+    with _state_lock:
+        if st.armed != when:
+            return  # superseded by an earlier timer
+        deadline = st.deadline
+        if deadline is not None and deadline > when:
+            # pushed back by later events: re-arm once for the latest deadline
+            st.armed = deadline
+            call_at(deadline, _fire_press, st, deadline)
+            return
+        st.armed = None
+        if deadline is None:
+            return  # already delivered without debounce
+        st.deadline = None
+    _deliver_press(st.mapped)
+
+def _schedule_press(st, delay):
+    """(Re)arm the debounce deadline of a key."""
+    deadline = time.monotonic_ns() + int(delay * 1_000_000_000)
+    with _state_lock:
+        st.deadline = deadline
+        armed = st.armed
+        # repeats only move the deadline; the armed timer catches up when it fires
+        if armed is None or deadline < armed:
+            st.armed = deadline
+            call_at(deadline, _fire_press, st, deadline)
+
+# Quadrature decoder: step for (previous AB << 2) | current AB, 0 for no move or invalid jumps
+QUAD_LUT = (0, -1, 1, 0, 1, 0, 0, -1, -1, 0, 0, 1, 0, 1, -1, 0)
+
+# Rotation gestures on pads 0..3: every ordered pick of pads along some
+# rotation of the clockwise / counterclockwise pad cycle. Rotations are
+# tried in turn, clockwise first, so short ambiguous picks keep the first match.
+def _build_rotation_table():
+    table = {}
+    cw, ccw = (0, 1, 2, 3), (0, 3, 2, 1)
+    for i in range(4):
+        for cycle, name in ((cw, "rotate_clockwise"), (ccw, "rotate_counterclockwise")):
+            rot = cycle[i:] + cycle[:i]
+            for n in range(1, 5):
+                for pick in combinations(rot, n):
+                    table.setdefault(pick, name)
+    return table
+
+_ROTATION_TABLE = _build_rotation_table()
+
+# Swipes through the center pad 4: (pad before, pad after) -> gesture
+_SWIPE_TABLE = {
+    (3, 1): "swipe_right",
+    (1, 3): "swipe_left",
+    (0, 2): "swipe_down",
+    (2, 0): "swipe_up",
+}
 
-        if debounce_data[mapped_key]["timer"] is not None:
-            debounce_data[mapped_key]["timer"].cancel()
+# === Key processing with debounce + remapping ===
+def process_key(key, repeat_code, DEBOUNCE_DELAY=DEBOUNCE_DELAY):
+    """
+    repeat_code: repeat counter as an int (0 = first press). External callers
+    may also pass it as a hex string; the built-in listeners pass ints so
+    nothing is parsed.
+    """
+    # remap target and debounce state in one lookup
+    st = _key_states.get(key) or _new_key_state(key)
 
-        t = threading.Timer(DEBOUNCE_DELAY, lambda: press_callback(mapped_key))
-        debounce_data[mapped_key]["timer"] = t
-        t.start()
+    if repeat_code.__class__ is not int:
+        try:
+            int(repeat_code, 16)
+        except Exception as e:
+            show_message(f"error process_key: {e}")
+            print("error process_key:", e)
+            return
+
+    if DEBOUNCE_DELAY <= 0:
+        # debounce disabled: deliver now, superseding any pending press
+        with _state_lock:
+            st.deadline = None
+        _deliver_press(st.mapped)
         return
 
-    if mapped_key not in debounce_data:
-        debounce_data[mapped_key] = {"max_code": rep, "timer": None}
-    else:
-        debounce_data[mapped_key]["max_code"] = max(debounce_data[mapped_key]["max_code"], rep)
-
-    if debounce_data[mapped_key]["timer"] is not None:
-        debounce_data[mapped_key]["timer"].cancel()
-
-    t = threading.Timer(DEBOUNCE_DELAY, lambda: press_callback(mapped_key))
-    debounce_data[mapped_key]["timer"] = t
-    t.start()
-
-def lirc_listener(process_key, config):
-    lirc_bouncetime = config.getfloat("lirc", "lirc_bouncetime_s", fallback=0.20)
+    # every event (first press or repeat) pushes the pending press back
+    _schedule_press(st, DEBOUNCE_DELAY)
+
+# === Input settings (resolved once from config.ini) ===
+DEFAULT_PAD_KEYS = {
+    0: "KEY_UP",
+    1: "KEY_RIGHT",
+    2: "KEY_DOWN",
+    3: "KEY_LEFT",
+    4: "KEY_OK",
+    5: "KEY_BACK",
+    6: "KEY_CHANNELUP",
+    7: "KEY_CHANNELDOWN",
+    8: "KEY_PLAY",
+    9: "KEY_INFO",
+    10: "KEY_STOP",
+    11: "KEY_POWER",
+    12: "KEY_PROX",
+}
+
+@dataclass(frozen=True)
+class InputConfig:
+    """Plain values the listeners need, so they do not keep the ConfigParser around."""
+    # LIRC
+    lirc_bouncetime: float = 0.20
+    lirc_socket: str = "/var/run/lirc/lircd"
+    # MPR121
+    mpr121_address: int = 0x5A
+    mpr121_int_pin: Optional[int] = None
+    touch_threshold: int = 30
+    release_threshold: int = 20
+    pad_keys: Tuple[str, ...] = tuple(DEFAULT_PAD_KEYS[i] for i in range(13))
+    pad_touch: Tuple[int, ...] = (30,) * 13
+    pad_release: Tuple[int, ...] = (20,) * 13
+    gesture_active: bool = False
+    # Rotary encoder
+    rotary_divider: int = 2
+    rotary_invert: bool = False
+    rotary_min_tick_ms: float = 2
+    rotary_bouncetime_ms: int = 10
+    rotary_pins: Optional[Tuple[int, int]] = None
+    # GPIO buttons: (BCM pin, key) pairs
+    buttons: Tuple[Tuple[int, str], ...] = ()
+    buttons_bouncetime_ms: int = 10
+    # gpiod backend
+    gpio_chip: str = "/dev/gpiochip0"
+
+def _get_setting(getter, section, option, fallback):
+    """Read one option with a ConfigParser getter; a malformed value is reported and replaced by fallback."""
     try:
-        proc = subprocess.Popen(
-            ["irw"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-            universal_newlines=True,
-        )
-        while True:
-            rlist, _, _ = select.select([proc.stdout], [], [], 0.1)
-            if rlist:
-                line = proc.stdout.readline()
-                if not line:
-                    break
-                parts = line.strip().split()
-                if len(parts) >= 3:
-                    key = parts[2].strip().upper()
-                    repeat_code = parts[1].strip()
-                    process_key(key, repeat_code, lirc_bouncetime)
-    except FileNotFoundError:
-        if show_message:
-            show_message("error: lirc missing")
-        print("error: lirc missing")
-    except Exception as e:
-        if show_message:
-            show_message(f"error lirc listener: {e}")
-        print("error lirc listener:", e)
-
-def mpr121_listener(process_key, config):
-    from .olipicap.mpr121 import MPR121
+        return getter(section, option, fallback=fallback)
+    except ValueError as e:
+        print(f"Error: {option} is invalid ({e}). Fallback to {fallback}")
+        return fallback
 
-    address = int(config.get("mpr121", "i2c_address", fallback="0x5A"), 0)
-    int_pin = config.getint("mpr121", "int_pin", fallback=None)
-    global_touch = config.getint("mpr121", "touch_threshold", fallback=30)
-    global_release = config.getint("mpr121", "release_threshold", fallback=20)
+def load_input_config(config):
+    """
+    Build an InputConfig from config.ini. Malformed values fall back to their
+    defaults one by one, so a typo only affects the setting it is in.
+    """
+    global_touch = _get_setting(config.getint, "mpr121", "touch_threshold", 30)
+    global_release = _get_setting(config.getint, "mpr121", "release_threshold", 20)
 
     # --- Pad mapping ---
-    PAD_KEY_MAPPING = {}
+    pad_keys = {}
     pad_touch_thresholds = {}
     pad_release_thresholds = {}
 
@@ -176,7 +418,7 @@ def mpr121_listener(process_key, config):
                     rth = int(parts[2]) if parts[2] not in ["", "-", "none"] else None
                 else:
                     action, tth, rth = parts[0].upper(), None, None
-                PAD_KEY_MAPPING[pad_index] = action
+                pad_keys[pad_index] = action
                 pad_touch_thresholds[pad_index] = (
                     tth if tth is not None else global_touch
                 )
@@ -187,47 +429,136 @@ def mpr121_listener(process_key, config):
                 print(f"error parsing {key}: {e}")
     else:
         # fallback default mapping
-        PAD_KEY_MAPPING = {
-            0: "KEY_UP",
-            1: "KEY_RIGHT",
-            2: "KEY_DOWN",
-            3: "KEY_LEFT",
-            4: "KEY_OK",
-            5: "KEY_BACK",
-            6: "KEY_CHANNELUP",
-            7: "KEY_CHANNELDOWN",
-            8: "KEY_PLAY",
-            9: "KEY_INFO",
-            10: "KEY_STOP",
-            11: "KEY_POWER",
-            12: "KEY_PROX",
-        }
+        pad_keys = DEFAULT_PAD_KEYS
+
+    try:
+        rotary_bouncetime_ms = config.getint("rotary", "rotary_bouncetime_ms", fallback=10)
+    except ValueError:
+        print("Error: rotary_bouncetime_ms must be an integer. Fallback to 10ms")
+        rotary_bouncetime_ms = 10
+
+    try:
+        rotary_pins = (config.getint("rotary", "pin_a"), config.getint("rotary", "pin_b"))
+    except (configparser.Error, ValueError) as e:
+        if config.has_section("rotary"):
+            print("error rotary:", e)
+        rotary_pins = None
+
+    # --- GPIO buttons ---
+    buttons = []
+    if config.has_section("buttons"):
+        for key, pin in config.items("buttons"):
+            if not key.upper().startswith("KEY_"):
+                continue
+            try:
+                buttons.append((int(pin), key.upper()))
+            except ValueError as e:
+                show_message(f"error gpio pin")
+                print("error gpio pin:", e)
+    try:
+        buttons_bouncetime_ms = config.getint("buttons", "buttons_bouncetime_ms", fallback=10)
+    except ValueError:
+        print("Error: buttons_bouncetime_ms must be an integer. Fallback to 10ms")
+        buttons_bouncetime_ms = 10
+
+    try:
+        mpr121_address = int(config.get("mpr121", "i2c_address", fallback="0x5A"), 0)
+    except ValueError as e:
+        print(f"Error: i2c_address is invalid ({e}). Fallback to 0x5A")
+        mpr121_address = 0x5A
+
+    return InputConfig(
+        lirc_bouncetime=_get_setting(config.getfloat, "lirc", "lirc_bouncetime_s", 0.20),
+        lirc_socket=config.get("lirc", "socket", fallback="/var/run/lirc/lircd"),
+        mpr121_address=mpr121_address,
+        mpr121_int_pin=_get_setting(config.getint, "mpr121", "int_pin", None),
+        touch_threshold=global_touch,
+        release_threshold=global_release,
+        # unmapped pads report as "PADn"
+        pad_keys=tuple(pad_keys.get(i, f"PAD{i}") for i in range(13)),
+        pad_touch=tuple(pad_touch_thresholds.get(i, global_touch) for i in range(13)),
+        pad_release=tuple(pad_release_thresholds.get(i, global_release) for i in range(13)),
+        gesture_active=_get_setting(config.getboolean, "mpr121", "use_gesture", False),
+        rotary_divider=_get_setting(config.getint, "rotary", "rotary_divider", 2),
+        rotary_invert=_get_setting(config.getboolean, "rotary", "rotary_invert", False),
+        rotary_min_tick_ms=_get_setting(config.getfloat, "rotary", "rotary_min_tick_ms", 2),
+        rotary_bouncetime_ms=rotary_bouncetime_ms,
+        rotary_pins=rotary_pins,
+        buttons=tuple(buttons),
+        buttons_bouncetime_ms=buttons_bouncetime_ms,
+        gpio_chip=config.get("input", "gpio_chip", fallback="/dev/gpiochip0"),
+    )
+
+def lirc_listener(process_key, cfg):
+    """Read lircd's socket directly on the input loop (no irw, no dedicated thread)."""
+    lirc_bouncetime = cfg.lirc_bouncetime
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(cfg.lirc_socket)
+    except OSError as e:  # no socket, lircd not running, no permission
+        sock.close()
+        show_message("error: lirc missing")
+        print("error: lirc missing:", e)
+        return
+    sock.setblocking(False)
+    pending = b""
+
+    def on_readable(sock):
+        nonlocal pending
+        try:
+            try:
+                data = sock.recv(4096)
+            except BlockingIOError:
+                return
+            if not data:
+                unregister_reader(sock)
+                sock.close()
+                return
+            # lircd is line oriented; keep any partial line for the next read
+            pending += data
+            *lines, pending = pending.split(b"\n")
+            for raw in lines:
+                # "<code> <repeat> <key> <remote>": only the first three fields are needed;
+                # lircd's BEGIN/SIGHUP/END broadcast lines fail to parse and are skipped
+                try:
+                    _, rep_s, key = raw.split(None, 3)[:3]
+                    rep = int(rep_s, 16)
+                except ValueError:
+                    continue
+                process_key(key.decode(errors="replace").upper(), rep, lirc_bouncetime)
+        except Exception as e:
+            show_message(f"error lirc listener: {e}")
+            print("error lirc listener:", e)
+
+    register_reader(sock, on_readable)
+
+def mpr121_listener(process_key, cfg):
+    from .olipicap.mpr121 import MPR121
+
+    address = cfg.mpr121_address
+    int_pin = cfg.mpr121_int_pin
+    global_touch = cfg.touch_threshold
+    global_release = cfg.release_threshold
+    pad_key_table = cfg.pad_keys
 
     # --- Init sensor ---
     time.sleep(0.5)
     sensor = MPR121(address)
     if not sensor.begin():
-        if show_message:
-            show_message("error: MPR121 init failed") if show_message else None
+        show_message("error: MPR121 init failed")
         print("error: MPR121 init failed")
         return
 
-    sensor.set_interrupt_pin(int_pin)
-    sensor.set_touch_threshold(global_touch)
-    sensor.set_release_threshold(global_release)
-    for i in range(13):
-        tth = pad_touch_thresholds.get(i, global_touch)
-        rth = pad_release_thresholds.get(i, global_release)
-        sensor.set_touch_threshold_for(i, tth)
-        sensor.set_release_threshold_for(i, rth)
+    if int_pin is not None:  # no INT pin: the status registers are polled instead
+        sensor.set_interrupt_pin(int_pin)
+    # per-pad values already fall back to the global thresholds
+    sensor.set_all_thresholds(cfg.pad_touch, cfg.pad_release)
 
     # --- Gesture tracking ---
-    gesture_history = []
+    gesture_history = deque(maxlen=8)  # unrecognised touch streams stay bounded
     gesture_timer = None
     GESTURE_TIMEOUT = 0.3
     DIR_NAMES = {0:"UP",1:"RIGHT",2:"DOWN",3:"LEFT"}
-    CLOCKWISE = [0,1,2,3]
-    COUNTERCLOCKWISE = [0,3,2,1]
 
     def detect_swipe(seq):
         if 4 not in seq:  # center pad missing
@@ -235,59 +566,24 @@ def mpr121_listener(process_key, config):
         idx_c = seq.index(4)
         if idx_c == 0 or idx_c == len(seq)-1:
             return None
-        start = seq[idx_c-1]
-        end = seq[idx_c+1]
-        if start == 3 and end == 1:
-            return "swipe_right"
-        if start == 1 and end == 3:
-            return "swipe_left"
-        if start == 0 and end == 2:
-            return "swipe_down"
-        if start == 2 and end == 0:
-            return "swipe_up"
-        return None
+        return _SWIPE_TABLE.get((seq[idx_c-1], seq[idx_c+1]))
 
     def detect_rotation(seq):
-        nums = [p for p in seq if p in (0,1,2,3)]
+        nums = [p for p in seq if p < 4]
         if len(nums) < 3:
             return None
-        for i in range(4):
-            cw = CLOCKWISE[i:] + CLOCKWISE[:i]
-            ccw = COUNTERCLOCKWISE[i:] + COUNTERCLOCKWISE[:i]
-            if all(n in cw for n in nums):
-                idx = 0
-                for n in nums:
-                    while idx < 4 and cw[idx] != n:
-                        idx += 1
-                    if idx >= 4: break
-                else:
-                    return "rotate_clockwise"
-            if all(n in ccw for n in nums):
-                idx = 0
-                for n in nums:
-                    while idx < 4 and ccw[idx] != n:
-                        idx += 1
-                    if idx >= 4: break
-                else:
-                    return "rotate_counterclockwise"
-        return None
+        # repeats of the same pad do not move the gesture along
+        nums = tuple(p for i, p in enumerate(nums) if i == 0 or nums[i - 1] != p)
+        return _ROTATION_TABLE.get(nums)
 
     def send_simple_keys():
         nonlocal gesture_history, gesture_timer
         gesture_timer = None
         if len(gesture_history) == 1:
             t = gesture_history[0]
-            key = PAD_KEY_MAPPING.get(t)
-            with repeat_lock:
-                if key not in repeat_threads:
-                    if debug:
-                        print(f"[MPR121][JOYSTICK] Simple Key: {key}")
-                    repeat_counts[key] = 0
-                    process_key(key, "00", 0.1)
-                    check_fn = lambda s=sensor, idx=t: s.get_touch_data(idx)
-                    t_thread = threading.Thread(target=repeat_sender, args=(key, check_fn), daemon=True)
-                    repeat_threads[key] = t_thread
-                    t_thread.start()
+            key = pad_key_table[t]
+            if start_repeat(key, partial(sensor.get_touch_data, t)) and debug:
+                print(f"[MPR121][JOYSTICK] Simple Key: {key}")
         gesture_history.clear()
 
     time.sleep(0.5)
@@ -297,9 +593,9 @@ def mpr121_listener(process_key, config):
         print("  per-pad config:")
         sensor.update_all()
         for i in range(13):
-            key = PAD_KEY_MAPPING.get(i, f"PAD{i}")
-            tth = pad_touch_thresholds.get(i, global_touch)
-            rth = pad_release_thresholds.get(i, global_release)
+            key = pad_key_table[i]
+            tth = cfg.pad_touch[i]
+            rth = cfg.pad_release[i]
             base = sensor.get_baseline_data(i)
             filt = sensor.get_filtered_data(i)
             diff = filt - base
@@ -307,216 +603,303 @@ def mpr121_listener(process_key, config):
     else:
         print(f"[mpr121_listener] started @0x{address:02X} touch={global_touch} release={global_release}")
 
-    last_state = set()
-    running = True
-    gesture_active = config.getboolean("mpr121", "use_gesture", fallback=False)
+    gesture_active = cfg.gesture_active
+    prev_status = sensor.get_touch_status_word()
+    swipe = rotation = None
 
-    while running:
-        try:
-            if sensor.touch_status_changed():
-                sensor.update_all()
-                touched = {i for i in range(5) if sensor.is_new_touch(i)}
-                released = {i for i in range(5) if sensor.is_new_release(i)}
-
-                # --- 1. Handle new touches (gesture / single key detection for the first 5 pads) ---
-                if gesture_active and touched:
-                    for t in touched:
-                        if not gesture_history or gesture_history[-1] != t:
-                            gesture_history.append(t)
-
-                    # Cancel timer if new gesture in progress
-                    if gesture_timer:
-                        gesture_timer.cancel()
-
-                    swipe = detect_swipe(gesture_history)
-                    rotation = detect_rotation(gesture_history)
-
-                    if swipe is not None:
-                        if debug:
-                            print(f"[MPR121][JOYSTICK] Gesture: {swipe}")
-                        gesture_history.clear()
-                    elif rotation is not None:
-                        if debug:
-                            print(f"[MPR121][JOYSTICK] Gesture: {rotation}")
-                        gesture_history.clear()
-                    else:
-                        # Start timer if no gesture found yet
-                        gesture_timer = threading.Timer(GESTURE_TIMEOUT, send_simple_keys)
-                        gesture_timer.start()
-
-                # --- 2. Handle releases (gesture / single key detection for the first 5 pads) ---
-                elif gesture_active and released:
-                    for t in released:
-                        key = PAD_KEY_MAPPING.get(t)
-                        with repeat_lock:
-                            repeat_counts.pop(key, None)
-                            repeat_threads.pop(key, None)
-                    if len(gesture_history) == 1 and not (swipe or rotation):
-                        if gesture_timer:
-                            gesture_timer.cancel()
-                        send_simple_keys()
+    def on_touch_change():
+        """Read the touch status and dispatch new touches / releases (runs on the input loop)."""
+        nonlocal prev_status, gesture_timer, swipe, rotation
+        # baseline/filtered values are only needed for debug output
+        if debug:
+            sensor.update_all()
+        else:
+            sensor.update_touch_data()
+        status = sensor.get_touch_status_word()
+        changed_mask = status ^ prev_status
+        if not changed_mask:
+            return
+        touched_mask = changed_mask & status
+        released_mask = changed_mask & prev_status
+        prev_status = status
+
+        # --- 1. Handle new touches (gesture / single key detection for the first 5 pads) ---
+        if gesture_active and touched_mask & 0x1F:
+            for t in range(5):
+                if (touched_mask >> t) & 1 and (not gesture_history or gesture_history[-1] != t):
+                    gesture_history.append(t)
+
+            # Cancel timer if new gesture in progress
+            cancel_timer(gesture_timer)
+            gesture_timer = None
+
+            swipe = detect_swipe(gesture_history)
+            rotation = detect_rotation(gesture_history)
+
+            if swipe is not None:
+                if debug:
+                    print(f"[MPR121][JOYSTICK] Gesture: {swipe}")
+                gesture_history.clear()
+            elif rotation is not None:
+                if debug:
+                    print(f"[MPR121][JOYSTICK] Gesture: {rotation}")
+                gesture_history.clear()
+            else:
+                # Start timer if no gesture found yet
+                gesture_timer = call_later(GESTURE_TIMEOUT, send_simple_keys)
+
+        # --- 2. Handle releases (gesture / single key detection for the first 5 pads) ---
+        elif gesture_active and released_mask & 0x1F:
+            for t in range(5):
+                if (released_mask >> t) & 1:
+                    stop_repeat(pad_key_table[t])
+            if len(gesture_history) == 1 and not (swipe or rotation):
+                cancel_timer(gesture_timer)
+                send_simple_keys()
 
+        else:
+            # walk the changed pads among 0..11 (touch electrodes not used for gestures or disabled)
+            changed = changed_mask & 0x0FFF
+            while changed:
+                low = changed & -changed
+                changed ^= low
+                i = low.bit_length() - 1
+                key = pad_key_table[i]
+                # NEW TOUCH: emit first press and start repeating (if not already held)
+                if touched_mask & low:
+                    if debug:
+                        base = sensor.get_baseline_data(i)
+                        filt = sensor.get_filtered_data(i)
+                        diff = filt - base
+                        print(f"[MPR121] TOUCH pad{i} -> {key:<15} base={base:4d} filt={filt:4d} diff={diff:+5d}")
+                    # repeats poll sensor.get_touch_data(i) while held
+                    start_repeat(key, partial(sensor.get_touch_data, i))
+                # RELEASE: stop repeating
                 else:
-                    # iterate through pads 0..11 (touch electrodes not used for gestures or disabled)
-                    for i in range(12):
-                        key = PAD_KEY_MAPPING.get(i, f"PAD{i}")
-                        # NEW TOUCH: start repeat thread (if not already running)
-                        if sensor.is_new_touch(i):
-                            with repeat_lock:
-                                if debug:
-                                    base = sensor.get_baseline_data(i)
-                                    filt = sensor.get_filtered_data(i)
-                                    diff = filt - base
-                                    print(f"[MPR121] TOUCH pad{i} -> {key:<15} base={base:4d} filt={filt:4d} diff={diff:+5d}")
-                                if key not in repeat_threads:
-                                    # initialize repeat counter and emit first press ("00")
-                                    repeat_counts[key] = 0
-                                    process_key(key, "00", 0.1)
-
-                                    # check_fn for this pad: poll sensor.get_touch_data(i)
-                                    check_fn = (lambda s=sensor, idx=i: s.get_touch_data(idx))
-                                    t = threading.Thread(target=repeat_sender, args=(key, check_fn), daemon=True)
-                                    repeat_threads[key] = t
-                                    t.start()
-                        # RELEASE: stop repeat thread by removing entries
-                        elif sensor.is_new_release(i):
-                            with repeat_lock:
-                                if debug:
-                                    print(f"[MPR121] TOUCH pad{i} -> {key:<15} was just released")
-                                repeat_counts.pop(key, None)
-                                repeat_threads.pop(key, None)
-
-            time.sleep(0.1)
-        except KeyboardInterrupt:
-            running = False
+                    if debug:
+                        print(f"[MPR121] TOUCH pad{i} -> {key:<15} was just released")
+                    stop_repeat(key)
+
+    # int_asserted() is True while INT is held low; None means no usable INT pin
+    int_asserted = None
+    int_req = None
+    if int_pin is not None:
+        if gpiod is not None:
+            try:
+                int_req = gpiod.request_lines(
+                    cfg.gpio_chip,
+                    consumer="olipi-mpr121",
+                    config={int_pin: gpiod.LineSettings(
+                        direction=Direction.INPUT,
+                        bias=Bias.PULL_UP,
+                        edge_detection=Edge.FALLING,
+                    )},
+                )
+                int_asserted = partial(_line_is_low, int_req, int_pin)
+            except Exception as e:
+                print("error mpr121 int pin, falling back to polling:", e)
+        elif GPIO is not None:
+            int_asserted = sensor.touch_status_changed
+
+    def check(on_edge=False):
+        try:
+            # an INT edge already signals a change, no need to sample the pin
+            if on_edge or int_asserted is None or int_asserted():
+                on_touch_change()
         except Exception as e:
             print("error mpr121 listener:", e)
-            if show_message:
-                show_message("error mpr121 listener")
-            time.sleep(0.1)
-
-def rotary_listener(pin_a, pin_b, process_key, config=None):
-    divider = config.getint("rotary", "rotary_divider", fallback=2)
-    invert = config.getboolean("rotary", "rotary_invert", fallback=False)
-    min_tick_ms = config.getfloat("rotary", "rotary_min_tick_ms", fallback=2)
-    try:
-        rotary_bouncetime_ms = config.getint("rotary", "rotary_bouncetime_ms", fallback=10)
-    except ValueError:
-        print("Error: rotary_bouncetime_ms must be an integer. Fallback to 10ms")
-        rotary_bouncetime_ms = 10
+            show_message("error mpr121 listener")
+
+    def poll(interval):
+        check()
+        call_later(interval, poll, interval)
+
+    def on_int_events(fd):
+        int_req.read_edge_events()  # drain; one check covers every queued edge
+        check(True)
+
+    # From here on everything runs on the input loop and this thread ends.
+    # INT falling edges queue a check, the slow poll only catches a missed edge;
+    # without a usable INT pin the touch status registers are polled at 50 Hz.
+    use_irq = int_asserted is not None
+    if int_req is not None:
+        register_reader(int_req.fd, on_int_events)
+    elif use_irq:
+        try:
+            GPIO.add_event_detect(int_pin, GPIO.FALLING, callback=lambda ch: call_later(0, check, True))
+        except Exception as e:
+            print("error mpr121 int pin, falling back to polling:", e)
+            use_irq = False
+    call_later(0, poll, 1.0 if use_irq else 0.02)
+
+def rotary_listener(pin_a, pin_b, process_key, cfg=None):
+    if cfg is None:
+        cfg = InputConfig()
+    divider = max(1, cfg.rotary_divider)  # a 0 threshold would divide by zero on the first step
+    invert = cfg.rotary_invert
+    min_tick_ns = int(cfg.rotary_min_tick_ms * 1_000_000)
+    rotary_bouncetime_ms = cfg.rotary_bouncetime_ms
 
     if debug:
         print(f"[rotary_listener] start pins A={pin_a} B={pin_b} divider={divider} invert={invert}")
 
-    last_state_a = GPIO.input(pin_a)
+    # quarter steps per key: rotary_divider counts A transitions, i.e. 2 quarter steps each
+    threshold = 2 * divider
+    prev_state = 0
     counter = 0
-    last_emit = time.time()
+    last_emit_ns = time.monotonic_ns()
     lock = threading.Lock()
-
-    def handle_edge(channel):
-        nonlocal last_state_a, counter, last_emit
-
-        a_state = GPIO.input(pin_a)
-        b_state = GPIO.input(pin_b)
-
-        if a_state != last_state_a:
-            now = time.time()
-            if (now - last_emit) * 1000 < min_tick_ms / 2:
-                # Ignore très courtes transitions (rebonds)
+    # closure cell instead of a global lookup per edge; inversion is folded into the table
+    lut = tuple(-step for step in QUAD_LUT) if invert else QUAD_LUT
+
+    def on_state(state, ts_ns):
+        """Feed the AB state seen at CLOCK_MONOTONIC time ts_ns to the decoder."""
+        nonlocal prev_state, counter, last_emit_ns
+        with lock:
+            step = lut[(prev_state << 2) | state]
+            prev_state = state
+            if not step:
+                return  # no move, or an invalid (bouncing) transition
+            counter += step
+            if abs(counter) < threshold or ts_ns - last_emit_ns < min_tick_ns:
                 return
+            # steps held back by min_tick are delivered together, the remainder is kept
+            n = abs(counter) // threshold
+            if counter > 0:
+                key = "KEY_UP"
+                counter -= n * threshold
+            else:
+                key = "KEY_DOWN"
+                counter += n * threshold
+            last_emit_ns = ts_ns
+        # hooks run outside the lock so a slow UI never stalls the next edges
+        if steps_callback is not None:
+            try:
+                steps_callback(remote_mapping.get(key, key) if _has_remap else key, n)
+            except Exception as e:
+                print("error steps_callback:", e)
+        else:
+            process_key(key, 0, 0.01)
+
+    if gpiod is not None:
+        # edges are read from the line request fd on the input loop; the kernel
+        # debounces them, timestamps each one and tells which line moved which way
+        req = gpiod.request_lines(
+            cfg.gpio_chip,
+            consumer="olipi-rotary",
+            config={(pin_a, pin_b): gpiod.LineSettings(
+                direction=Direction.INPUT,
+                bias=Bias.PULL_UP,
+                edge_detection=Edge.BOTH,
+                debounce_period=timedelta(milliseconds=rotary_bouncetime_ms),
+            )},
+        )
+        a, b = req.get_values([pin_a, pin_b])
+        state = ((a == Value.ACTIVE) << 1) | (b == Value.ACTIVE)
+        prev_state = state
+        line_bits = {pin_a: 2, pin_b: 1}
+
+        def on_events(fd):
+            nonlocal state
+            for ev in req.read_edge_events():
+                bit = line_bits[ev.line_offset]
+                if ev.event_type == ev.Type.RISING_EDGE:
+                    state |= bit
+                else:
+                    state &= ~bit
+                on_state(state, ev.timestamp_ns)
 
-            direction = +1 if b_state != a_state else -1
-            if invert:
-                direction = -direction
+        register_reader(req.fd, on_events)
+        return
 
-            with lock:
-                counter += direction
-                if abs(counter) >= divider and (now - last_emit) * 1000 >= min_tick_ms:
-                    key = "KEY_UP" if counter > 0 else "KEY_DOWN"
-                    process_key(key, "00", 0.01)
-                    counter = 0
-                    last_emit = now
+    GPIO.setup(pin_a, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+    GPIO.setup(pin_b, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+    prev_state = (GPIO.input(pin_a) << 1) | GPIO.input(pin_b)
 
-        last_state_a = a_state
+    def handle_edge(channel, _input=GPIO.input, _now_ns=time.monotonic_ns):
+        on_state((_input(pin_a) << 1) | _input(pin_b), _now_ns())
 
+    # edges are delivered by RPi.GPIO callbacks, no thread of our own is needed
     GPIO.add_event_detect(pin_a, GPIO.BOTH, callback=handle_edge, bouncetime=rotary_bouncetime_ms)
     GPIO.add_event_detect(pin_b, GPIO.BOTH, callback=handle_edge, bouncetime=rotary_bouncetime_ms)
 
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        GPIO.remove_event_detect(pin_a)
-        GPIO.remove_event_detect(pin_b)
-
 # === Main entrance ===
-def start_inputs(config, process_press, msg_hook=None):
-    global show_message, press_callback, remote_mapping, debug
-    show_message = msg_hook
+def start_inputs(config, process_press, msg_hook=None, process_steps=None):
+    """
+    process_press(key) receives debounced key presses. If process_steps(key, n)
+    is given, rotary turns go there instead, with n detents per call.
+    """
+    global show_message, press_callback, steps_callback, remote_mapping, _has_remap, debug
+    show_message = msg_hook or _no_message
     press_callback = process_press
+    steps_callback = process_steps
     debug = config.getboolean("settings", "debug", fallback=False)
 
     # Load key mapping
-    remote_mapping = {}
+    mapping = {}
     if config.has_section("remote_mapping"):
         for action, remote_key in config.items("remote_mapping"):
-            action = action.strip().upper()
             remote_key = remote_key.strip().upper()
-            if not remote_key or remote_key in ["—", "-", "NONE", "YOUR_REMOTE_KEY"]:
+            if remote_key in _UNSET_REMOTE_KEYS:
                 continue
-            remote_mapping[remote_key] = action
+            mapping[sys.intern(remote_key)] = sys.intern(action.strip().upper())
+    # read-only from here on: listener threads only ever look keys up
+    remote_mapping = MappingProxyType(mapping)
+    _has_remap = bool(remote_mapping)
+    _key_states.clear()
+    _mapped_states.clear()
 
     if remote_mapping:
         print(f"Loaded {len(remote_mapping)} remote key mappings")
     else:
         print("No valid remote mappings found, using raw keys")
 
+    cfg = load_input_config(config)
+
     # LIRC
     if config.getboolean("input", "use_lirc", fallback=False):
-        threading.Thread(target=lirc_listener, args=(process_key, config), daemon=True).start()
+        lirc_listener(process_key, cfg)
 
     # MPR121
     if config.getboolean("input", "use_mpr121", fallback=False):
-        threading.Thread(target=mpr121_listener, args=(process_key, config), daemon=True).start()
+        threading.Thread(target=mpr121_listener, args=(process_key, cfg), daemon=True).start()
 
     # GPIO boutons
     if config.getboolean("input", "use_buttons", fallback=False):
-        try:
-            buttons_bouncetime_ms = config.getint("buttons", "buttons_bouncetime_ms", fallback=10)
-        except ValueError:
-            print("Error: buttons_bouncetime_ms must be an integer. Fallback to 10ms")
-            buttons_bouncetime_ms = 10
-        if GPIO is None:
+        if GPIO is None and gpiod is None:
             print("error: gpio missing")
-            if show_message:
-                show_message("error: gpio missing")
-        elif config.has_section("buttons"):
-            for key, pin in config.items("buttons"):
-                if not key.upper().startswith("KEY_"):
-                    continue
+            show_message("error: gpio missing")
+        elif gpiod is not None:
+            if cfg.buttons:
+                try:
+                    gpiod_buttons(dict(cfg.buttons), cfg.buttons_bouncetime_ms, cfg.gpio_chip)
+                except Exception as e:
+                    show_message(f"error gpio pin")
+                    print("error gpio pin:", e)
+        else:
+            pin_keys = dict(cfg.buttons)
+
+            def button_cb(channel, _keys=pin_keys):
+                gpio_event(channel, _keys[channel])
+
+            for pin in pin_keys:
                 try:
-                    pin = int(pin)
                     GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
                     GPIO.add_event_detect(
                         pin,
                         GPIO.BOTH,
-                        callback=lambda ch, k=key.upper(), p=pin: gpio_event(p, k),
-                        bouncetime=buttons_bouncetime_ms,
+                        callback=button_cb,
+                        bouncetime=cfg.buttons_bouncetime_ms,
                     )
                 except Exception as e:
-                    if show_message:
-                        show_message(f"error gpio pin")
+                    show_message(f"error gpio pin")
                     print("error gpio pin:", e)
 
     # Rotary encoder
-    if config.getboolean("input", "use_rotary", fallback=False) and config.has_section("rotary") and GPIO:
+    if config.getboolean("input", "use_rotary", fallback=False) and cfg.rotary_pins and (gpiod or GPIO):
         try:
-            pin_a = config.getint("rotary", "pin_a")
-            pin_b = config.getint("rotary", "pin_b")
-            GPIO.setup(pin_a, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            GPIO.setup(pin_b, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            threading.Thread(target=rotary_listener, args=(pin_a, pin_b, process_key, config), daemon=True).start()
+            pin_a, pin_b = cfg.rotary_pins
+            rotary_listener(pin_a, pin_b, process_key, cfg)
         except Exception as e:
-            if show_message:
-                show_message(f"error rotary: {e}")
+            show_message(f"error rotary: {e}")
             print("error rotary:", e)
@@ -7,6 +7,7 @@
 from dataclasses import dataclass
 import time
 import os
+import struct
 from typing import Optional, List
 
 # Optional SMBus
@@ -155,6 +156,10 @@ MPR121_TL        = 0x7F
 # soft reset
 MPR121_SRST      = 0x80
 
+# per-electrode threshold registers (touch/release interleaved)
+_TTH_REGS = tuple(MPR121_E0TTH + (i << 1) for i in range(13))
+_RTH_REGS = tuple(MPR121_E0RTH + (i << 1) for i in range(13))
+
 
 # --------------------------- Helper enums / constants ---------------------
 PROX_DISABLED = 0
@@ -234,6 +239,7 @@ class MPR121:
         self.default_settings = MPR121Settings()
         self.ECR_backup = 0x00
         self._error = 1 << 0  # NOT_INITED
+        self._inited = False  # mirrors the NOT_INITED bit, checked by every accessor
         self.running = False
         self.interrupt_pin: Optional[int] = None
         self.filtered_data: List[int] = [0]*13
@@ -268,22 +274,31 @@ class MPR121:
         self._bus.i2c_rdwr(write, read)
         return list(read)[0]
 
+    def _read_block(self, reg: int, n: int) -> bytes:
+        """Read n consecutive registers starting at 'reg' in one transaction (auto-increment)."""
+        self._ensure_bus()
+        write = i2c_msg.write(self.address, [reg])
+        read = i2c_msg.read(self.address, n)
+        self._bus.i2c_rdwr(write, read)
+        return bytes(read)
+
     def _write_byte(self, reg: int, val: int) -> None:
         """Write a single byte (val & 0xFF) to register 'reg'."""
         self._ensure_bus()
         self._bus.write_byte_data(self.address, reg, val & 0xFF)
 
+    def _write_block(self, reg: int, data) -> None:
+        """Write consecutive registers starting at 'reg' in one transaction (auto-increment)."""
+        self._ensure_bus()
+        self._bus.i2c_rdwr(i2c_msg.write(self.address, [reg] + [v & 0xFF for v in data]))
+
     def _read_word_le(self, reg: int) -> int:
         """Read two bytes LSB/MSB at reg using repeated start, return signed 16-bit value."""
         self._ensure_bus()
         write = i2c_msg.write(self.address, [reg])
         read = i2c_msg.read(self.address, 2)
         self._bus.i2c_rdwr(write, read)
-        lo, hi = list(read)
-        val = (hi << 8) | lo
-        if val & 0x8000:
-            val -= 0x10000
-        return val
+        return struct.unpack("<h", bytes(read))[0]
 
     # -------------------- High level -------------------------
     def begin(self, address: Optional[int] = None) -> bool:
@@ -306,7 +321,7 @@ class MPR121:
             self._error |= (1 << 1)
             return False
 
-        self._error &= ~(1 << 0)  # clear NOT_INITED
+        self._mark_inited()
 
         if self.reset():
             # apply defaults (this will also set thresholds)
@@ -339,7 +354,7 @@ class MPR121:
         except Exception:
             self._error |= (1 << 2)
 
-        if self.get_error() in (NOT_INITED, NO_ERROR):
+        if self.get_error(check_oor=True) in (NOT_INITED, NO_ERROR):
             return True
         return False
 
@@ -354,47 +369,30 @@ class MPR121:
         if was_running:
             self.stop()
 
-        # Write core filter/AFE registers (order like C++ original)
-        # NOTE: ensure constants exist in module (we kept same names)
-        self.set_register(MPR121_MHDR, settings.MHDR)
-        self.set_register(MPR121_NHDR, settings.NHDR)
-        self.set_register(MPR121_NCLR, settings.NCLR)
-        self.set_register(MPR121_FDLR, settings.FDLR)
-        self.set_register(MPR121_MHDF, settings.MHDF)
-        self.set_register(MPR121_NHDF, settings.NHDF)
-        self.set_register(MPR121_NCLF, settings.NCLF)
-        self.set_register(MPR121_FDLF, settings.FDLF)
-        self.set_register(MPR121_NHDT, settings.NHDT)
-        self.set_register(MPR121_NCLT, settings.NCLT)
-        self.set_register(MPR121_FDLT, settings.FDLT)
-        self.set_register(MPR121_MHDPROXR, settings.MHDPROXR)
-        self.set_register(MPR121_NHDPROXR, settings.NHDPROXR)
-        self.set_register(MPR121_NCLPROXR, settings.NCLPROXR)
-        self.set_register(MPR121_FDLPROXR, settings.FDLPROXR)
-        self.set_register(MPR121_MHDPROXF, settings.MHDPROXF)
-        self.set_register(MPR121_NHDPROXF, settings.NHDPROXF)
-        self.set_register(MPR121_NCLPROXF, settings.NCLPROXF)
-        self.set_register(MPR121_FDLPROXF, settings.FDLPROXF)
-        self.set_register(MPR121_NHDPROXT, settings.NHDPROXT)
-        self.set_register(MPR121_NCLPROXT, settings.NCLPROXT)
-        self.set_register(MPR121_FDLPROXT, settings.FDLPROXT)
-        self.set_register(MPR121_DTR, settings.DTR)
-        self.set_register(MPR121_AFE1, settings.AFE1)
-        self.set_register(MPR121_AFE2, settings.AFE2)
-        self.set_register(MPR121_ACCR0, settings.ACCR0)
-        self.set_register(MPR121_ACCR1, settings.ACCR1)
-        self.set_register(MPR121_USL, settings.USL)
-        self.set_register(MPR121_LSL, settings.LSL)
-        self.set_register(MPR121_TL, settings.TL)
+        # Write core filter/AFE registers (order like C++ original), one
+        # auto-increment block per contiguous register run
+        self._write_block(MPR121_MHDR, (            # 0x2B..0x40
+            settings.MHDR, settings.NHDR, settings.NCLR, settings.FDLR,
+            settings.MHDF, settings.NHDF, settings.NCLF, settings.FDLF,
+            settings.NHDT, settings.NCLT, settings.FDLT,
+            settings.MHDPROXR, settings.NHDPROXR, settings.NCLPROXR, settings.FDLPROXR,
+            settings.MHDPROXF, settings.NHDPROXF, settings.NCLPROXF, settings.FDLPROXF,
+            settings.NHDPROXT, settings.NCLPROXT, settings.FDLPROXT,
+        ))
+        self._write_block(MPR121_DTR, (             # 0x5B..0x5D
+            settings.DTR, settings.AFE1, settings.AFE2,
+        ))
+        self._write_block(MPR121_ACCR0, (           # 0x7B..0x7F
+            settings.ACCR0, settings.ACCR1, settings.USL, settings.LSL, settings.TL,
+        ))
 
         # Set ECR last (affects running state)
         self.set_register(MPR121_ECR, settings.ECR)
 
-        self._error &= ~(1 << 0)  # clear NOT_INITED
+        self._mark_inited()
 
         # thresholds and interrupt pin
-        self.set_touch_threshold(settings.TTHRESH)
-        self.set_release_threshold(settings.RTHRESH)
+        self.set_thresholds(settings.TTHRESH, settings.RTHRESH)
         try:
             self.set_interrupt_pin(settings.INTERRUPT)
         except Exception:
@@ -404,16 +402,25 @@ class MPR121:
         if was_running:
             self.run()
 
-    def get_error(self) -> int:
-        """Return a single error code integer similar to the C++ API."""
-        # Read OOR regs first (some chips clear IRQ on read)
-        try:
-            self.get_register(MPR121_OORS1)
-            self.get_register(MPR121_OORS2)
-        except Exception:
-            pass
+    def get_error(self, check_oor: bool = False) -> int:
+        """
+        Return a single error code integer similar to the C++ API.
+
+        The out of range status is only read from the chip when check_oor is
+        True; otherwise the flag last recorded by get_register() is used.
+        """
+        if check_oor:
+            # Read OOR regs first (some chips clear IRQ on read), both in one transaction
+            try:
+                oors1, oors2 = self._read_block(MPR121_OORS1, 2)
+                if oors1 or oors2:
+                    self._error |= (1 << 4)  # out of range
+                else:
+                    self._error &= ~(1 << 4)
+            except Exception:
+                pass
 
-        if not self.is_inited():
+        if not self._inited:
             print("MPR121 not initialized")
             return NOT_INITED
         if (self._error & (1 << 1)) != 0:
@@ -433,12 +440,18 @@ class MPR121:
 
     def clear_error(self) -> None:
         self._error = 0
+        self._inited = True
 
     def is_running(self) -> bool:
         return self.running
 
     def is_inited(self) -> bool:
-        return (self._error & (1 << 0)) == 0
+        return self._inited
+
+    def _mark_inited(self) -> None:
+        """Clear NOT_INITED; keeps _error and _inited in step."""
+        self._error &= ~(1 << 0)
+        self._inited = True
 
     # -------------------- Register access with state handling ----------
     def set_register(self, reg: int, value: int) -> None:
@@ -480,79 +493,93 @@ class MPR121:
 
     # -------------------- run / stop ------------------------------------
     def run(self) -> None:
-        if not self.is_inited():
+        if not self._inited:
             return
         self.set_register(MPR121_ECR, self.ECR_backup)
 
     def stop(self) -> None:
-        if not self.is_inited():
+        if not self._inited:
             return
         self.ECR_backup = self.get_register(MPR121_ECR)
         self.set_register(MPR121_ECR, self.ECR_backup & 0xC0)
 
     # -------------------- touch / baseline / filtered updates ------------
     def update_touch_data(self) -> None:
-        """Read TS1/TS2 and update touch_data / last_touch_data."""
-        if not self.is_inited():
+        """Read TS1/TS2 (one I2C transaction) and update touch_data / last_touch_data."""
+        if not self._inited:
             return
         self.auto_touch_status_flag = False
         self.last_touch_data = self.touch_data
-        ts1 = self.get_register(MPR121_TS1)
-        ts2 = self.get_register(MPR121_TS2)
+        ts1, ts2 = self._read_block(MPR121_TS1, 2)
+        # same flag bookkeeping as get_register(MPR121_TS1/TS2): overcurrent
+        # follows TS2 bit 7, out of range is cleared (TS regs are not OORS)
+        if ts2 & 0x80:
+            self._error |= (1 << 3)
+        else:
+            self._error &= ~(1 << 3)
+        self._error &= ~(1 << 4)
         self.touch_data = ts1 | (ts2 << 8)
 
     def get_touch_data(self, electrode: int) -> bool:
-        if electrode > 12 or not self.is_inited():
+        if electrode > 12 or not self._inited:
             return False
         return ((self.touch_data >> electrode) & 1) == 1
 
+    def get_touch_status_word(self) -> int:
+        """Touch bitmap (bit n = electrode n) from the last update_touch_data()."""
+        if not self._inited:
+            return 0
+        return self.touch_data
+
     def get_num_touches(self) -> int:
-        if not self.is_inited():
+        if not self._inited:
             return 0xFF
-        return sum(1 for i in range(13) if self.get_touch_data(i))
+        return bin(self.touch_data & 0x1FFF).count("1")  # popcount of the 13 electrode bits
 
     def get_last_touch_data(self, electrode: int) -> bool:
-        if electrode > 12 or not self.is_inited():
+        if electrode > 12 or not self._inited:
             return False
         return ((self.last_touch_data >> electrode) & 1) == 1
 
     def update_filtered_data(self) -> bool:
         """Read filtered values for all electrodes into self.filtered_data."""
-        if not self.is_inited():
+        if not self._inited:
             return False
         if self.touch_status_changed():
             self.auto_touch_status_flag = True
-        for i in range(13):
-            self.filtered_data[i] = self._read_word_le(MPR121_E0FDL + (i * 2))
+        # E0FDL..E12FDH in one read, same signed LSB/MSB decoding as _read_word_le
+        self.filtered_data[:] = struct.unpack("<13h", self._read_block(MPR121_E0FDL, 26))
         return True
 
     def get_filtered_data(self, electrode: int) -> int:
-        if electrode > 12 or not self.is_inited():
+        if electrode > 12 or not self._inited:
             return 0xFFFF
         return self.filtered_data[electrode]
 
     def update_baseline_data(self) -> bool:
         """Read baseline values (8-bit registers shifted left by 2 like original driver)."""
-        if not self.is_inited():
+        if not self._inited:
             return False
         if self.touch_status_changed():
             self.auto_touch_status_flag = True
-        for i in range(13):
-            self.baseline_data[i] = (self.get_register(MPR121_E0BV + i) << 2)
+        # E0BV..E12BV in one read
+        self.baseline_data[:] = [b << 2 for b in self._read_block(MPR121_E0BV, 13)]
+        # get_register() on these clears the overcurrent / out of range flags
+        self._error &= ~((1 << 3) | (1 << 4))
         return True
 
     def get_baseline_data(self, electrode: int) -> int:
-        if electrode > 12 or not self.is_inited():
+        if electrode > 12 or not self._inited:
             return 0xFFFF
         return self.baseline_data[electrode]
 
     def is_new_touch(self, electrode: int) -> bool:
-        if electrode > 12 or not self.is_inited():
+        if electrode > 12 or not self._inited:
             return False
         return (self.get_last_touch_data(electrode) == False) and (self.get_touch_data(electrode) == True)
 
     def is_new_release(self, electrode: int) -> bool:
-        if electrode > 12 or not self.is_inited():
+        if electrode > 12 or not self._inited:
             return False
         return (self.get_last_touch_data(electrode) == True) and (self.get_touch_data(electrode) == False)
 
@@ -565,49 +592,71 @@ class MPR121:
     # -------------------- thresholds helpers -----------------------------
     def set_touch_threshold(self, val: int) -> None:
         """Set same touch threshold for all electrodes (0..255)."""
-        if not self.is_inited():
+        if not self._inited:
             return
         was_running = self.running
         if was_running:
             self.stop()
-        for i in range(13):
-            self.set_touch_threshold_for(i, val)
+        # thresholds are interleaved (E0TTH, E0RTH, E1TTH, ...): read all 26, patch, write back
+        buf = bytearray(self._read_block(MPR121_E0TTH, 26))
+        buf[0::2] = bytes([val & 0xFF]) * 13
+        self._write_block(MPR121_E0TTH, buf)
         if was_running:
             self.run()
 
     def set_touch_threshold_for(self, electrode: int, val: int) -> None:
         """Set touch threshold for specified electrodes (0..255)."""
-        if electrode > 12 or not self.is_inited():
+        if electrode > 12 or not self._inited:
             return
-        self.set_register(MPR121_E0TTH + (electrode << 1), val)
+        self.set_register(_TTH_REGS[electrode], val)
 
     def set_release_threshold(self, val: int) -> None:
         """Set same release threshold for all electrodes."""
-        if not self.is_inited():
+        if not self._inited:
             return
         was_running = self.running
         if was_running:
             self.stop()
-        for i in range(13):
-            self.set_release_threshold_for(i, val)
+        # thresholds are interleaved (E0TTH, E0RTH, E1TTH, ...): read all 26, patch, write back
+        buf = bytearray(self._read_block(MPR121_E0TTH, 26))
+        buf[1::2] = bytes([val & 0xFF]) * 13
+        self._write_block(MPR121_E0TTH, buf)
         if was_running:
             self.run()
 
     def set_release_threshold_for(self, electrode: int, val: int) -> None:
         """Set release threshold for specified electrodes."""
-        if electrode > 12 or not self.is_inited():
+        if electrode > 12 or not self._inited:
+            return
+        self.set_register(_RTH_REGS[electrode], val)
+
+    def set_all_thresholds(self, touch: List[int], release: List[int]) -> None:
+        """Set touch/release thresholds of all 13 electrodes in a single I2C write."""
+        if not self._inited:
             return
-        self.set_register(MPR121_E0RTH + (electrode << 1), val)
+        was_running = self.running
+        if was_running:
+            self.stop()
+        buf = []
+        for tth, rth in zip(touch, release):
+            buf += (tth, rth)
+        self._write_block(MPR121_E0TTH, buf[:26])
+        if was_running:
+            self.run()
+
+    def set_thresholds(self, touch: int, release: int) -> None:
+        """Set the same touch/release thresholds on all electrodes in a single I2C write."""
+        self.set_all_thresholds([touch] * 13, [release] * 13)
 
     def get_touch_threshold(self, electrode: int) -> int:
-        if electrode > 12 or not self.is_inited():
+        if electrode > 12 or not self._inited:
             return 0xFF
-        return self.get_register(MPR121_E0TTH + (electrode << 1))
+        return self.get_register(_TTH_REGS[electrode])
 
     def get_release_threshold(self, electrode: int) -> int:
-        if electrode > 12 or not self.is_inited():
+        if electrode > 12 or not self._inited:
             return 0xFF
-        return self.get_register(MPR121_E0RTH + (electrode << 1))
+        return self.get_register(_RTH_REGS[electrode])
 
     # -------------------- interrupt / status -----------------------
     def set_interrupt_pin(self, pin: int) -> None:
@@ -615,7 +664,7 @@ class MPR121:
         Configure an INT pin number for the Pi (BCM numbering). If RPi.GPIO is
         not available we still store the pin number (useful in higher layers).
         """
-        if not self.is_inited():
+        if not self._inited:
             return
         self.interrupt_pin = pin
         if not GPIO_AVAILABLE:
@@ -641,7 +690,7 @@ class MPR121:
     # -------------------- proximity / calibration -----------------
     def set_prox_mode(self, mode: int) -> None:
         """Configure proximity sensing mode (none / 1 / 4 / 12 electrodes)."""
-        if not self.is_inited():
+        if not self._inited:
             return
         was_running = self.running
         if was_running:
@@ -662,7 +711,7 @@ class MPR121:
 
     def set_calibration_lock(self, lock: int) -> None:
         """Lock or unlock calibration registers with optional bit-copy modes."""
-        if not self.is_inited():
+        if not self._inited:
             return
         was_running = self.running
         if was_running:
@@ -683,7 +732,7 @@ class MPR121:
 
     def set_num_enabled_electrodes(self, numElectrodes: int) -> None:
         """Set the number of touch electrodes (0-12) to enable."""
-        if not self.is_inited():
+        if not self._inited:
             return
         if numElectrodes > 12:
             numElectrodes = 12
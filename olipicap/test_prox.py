@@ -29,8 +29,7 @@ sensor.set_prox_mode(2)
 # Release threshold: should be slightly lower
 touch_threshold = 20
 release_threshold = 15
-sensor.set_touch_threshold(touch_threshold)
-sensor.set_release_threshold(release_threshold)
+sensor.set_thresholds(touch_threshold, release_threshold)
 
 # Configure visualization settings
 electrodes_range = range(13)  # 0–11 = touch electrodes, 12 = virtual proximity
@@ -72,12 +71,13 @@ try:
         print("Elec | Touch | Diff | Visualization")
         print("-" * 60)
 
+        # All 13 electrodes at once from the freshly read arrays
+        touched = sensor.get_touch_status_word()
+        diffs = [b - f for b, f in zip(sensor.baseline_data, sensor.filtered_data)]
+
         for i in electrodes_range:
-            # Read sensor data
-            touch = int(sensor.get_touch_data(i))
-            filtered = sensor.get_filtered_data(i)
-            baseline = sensor.get_baseline_data(i)
-            diff = baseline - filtered
+            touch = (touched >> i) & 1
+            diff = diffs[i]
 
             # Create a simple bar graph of the difference
             bar_len = int(max(0, min(max_bar, diff / 2)))
@@ -44,7 +44,7 @@ def refresh(img=None):
 
 def clear_display():
     """Clear buffer and physical display."""
-    draw.rectangle((0, 0, width, height), fill=0)
+    image.paste(0, (0, 0, width, height))  # C-level fill, no ImageDraw path
     refresh()
 
 def poweroff_safe():